@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 import argparse
+import os
 import sys
 from pathlib import Path
 from PIL import Image
 
+# Optional: parses only the PNG IHDR chunk, much faster than Pillow for size probes
+try:
+    import imagesize
+    HAVE_IMAGESIZE = True
+except ImportError:
+    HAVE_IMAGESIZE = False
+
+# Output file buffer size (bytes); batches zlib's small PNG chunk writes
+WRITE_BUFFER_SIZE = 128 * 1024
+
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
@@ -14,6 +25,27 @@ def progress_bar(i: int, n: int, width: int = 40):
     sys.stdout.write(f"\r[{bar}] {i}/{n} ({pct:5.1f}%)")
     sys.stdout.flush()
 
+def probe_sizes(folder: Path, names):
+    """
+    Read (w, h) for each file from its PNG header only; no pixel data is decoded.
+    Files whose header can't be read are reported and left out.
+    """
+    sizes = {}
+    for name in names:
+        try:
+            if HAVE_IMAGESIZE:
+                size = imagesize.get(str(folder / name))
+                if size[0] < 0:
+                    raise ValueError("unrecognized PNG header")
+            else:
+                with Image.open(folder / name) as im:
+                    size = im.size
+        except Exception as ex:
+            eprint(f"Error processing '{name}': {ex}")
+            continue
+        sizes[name] = size
+    return sizes
+
 def concat_side_by_side(img_left: Image.Image, img_right: Image.Image) -> Image.Image:
     if img_left.size != img_right.size:
         raise ValueError(f"Image sizes differ: {img_left.size} vs {img_right.size}")
@@ -57,7 +89,9 @@ def main():
 
     # Collect PNG filenames
     def png_names(folder: Path):
-        return {f.name for f in folder.iterdir() if f.is_file() and f.suffix.lower() == ".png"}
+        # scandir entries carry cached type info, so is_file() needs no extra stat()
+        with os.scandir(folder) as it:
+            return {e.name for e in it if e.is_file() and e.name.lower().endswith(".png")}
 
     names1 = png_names(dir1)
     names2 = png_names(dir2)
@@ -67,6 +101,15 @@ def main():
         eprint("No matching PNG filenames found in both folders.")
         sys.exit(2)
 
+    # Header-only sweep: reject size mismatches before any pixel decode happens
+    sizes1 = probe_sizes(dir1, common)
+    sizes2 = probe_sizes(dir2, common)
+    probed = [n for n in common if n in sizes1 and n in sizes2]
+    mismatched = [n for n in probed if sizes1[n] != sizes2[n]]
+    for fname in mismatched:
+        eprint(f"Error processing '{fname}': Resolution mismatch: {sizes1[fname]} vs {sizes2[fname]}")
+    common = [n for n in probed if sizes1[n] == sizes2[n]]
+
     total = len(common)
     print(f"Found {total} matching PNG(s). Output => {out_dir}")
     processed = 0
@@ -77,12 +120,9 @@ def main():
 
         try:
             with Image.open(left_path) as left_img, Image.open(right_path) as right_img:
-                if left_img.size != right_img.size:
-                    raise ValueError(
-                        f"Resolution mismatch for '{fname}': {left_img.size} vs {right_img.size}"
-                    )
                 combined = concat_side_by_side(left_img, right_img)
-                combined.save(out_dir / fname, format="PNG", compress_level=6, optimize=True)
+                with open(out_dir / fname, "wb", buffering=WRITE_BUFFER_SIZE) as fp:
+                    combined.save(fp, format="PNG", compress_level=6, optimize=True)
         except Exception as ex:
             eprint(f"\nError processing '{fname}': {ex}")
 
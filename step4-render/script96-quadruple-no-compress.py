@@ -25,6 +25,9 @@ Bit-depth behavior:
 """
 
 from pathlib import Path
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import os
 import sys
 import argparse
 import math
@@ -32,6 +35,13 @@ import math
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+# Optional: JIT-compiled blend that skips fully transparent overlay pixels
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 # =========================
 # Config — edit these
 # =========================
@@ -86,6 +96,16 @@ FONT_PATH_BR = "RobotoCondensed.ttf"
 FONT_SIZE_BR = 13
 FONT_COLOR_BR = (0, 0, 0, 255)
 
+# PNG zlib level for output frames: 1 encodes ~5x faster than Pillow's default 6.
+# Set ECDOSIM_PNG_LEVEL=9 for a final release encode.
+PNG_COMPRESS_LEVEL = int(os.environ.get("ECDOSIM_PNG_LEVEL", 1))
+
+# Worker processes for the per-frame pipeline (decode -> overlay -> encode)
+WORKERS = os.cpu_count() or 1
+
+# Max rendered corner tiles kept between frames (static corners need 1 each)
+OVERLAY_CACHE_SIZE = 256
+
 # ===========================================================
 
 def load_font(font_path: str, size: int):
@@ -95,6 +115,15 @@ def load_font(font_path: str, size: int):
         print(f"[warn] Could not load font '{font_path}'; using default font.")
         return ImageFont.load_default()
 
+_FONT_CACHE = {}
+
+def get_font(font_path: str, size: int):
+    """load_font, cached per process so each worker loads every font once."""
+    key = (font_path, size)
+    if key not in _FONT_CACHE:
+        _FONT_CACHE[key] = load_font(font_path, size)
+    return _FONT_CACHE[key]
+
 def _text_size(font, text):
     if hasattr(font, "getbbox"):
         x0, y0, x1, y1 = font.getbbox(text)
@@ -108,6 +137,32 @@ def _line_height(font):
     _, h = _text_size(font, "Mg")
     return h
 
+def _line_bbox(font, text, x, y):
+    """Pixel box (x0, y0, x1, y1) covered by text drawn with its origin at (x, y)."""
+    if hasattr(font, "getbbox"):
+        x0, y0, x1, y1 = font.getbbox(text)
+        return (int(x + x0), int(y + y0), int(math.ceil(x + x1)), int(math.ceil(y + y1)))
+    tw, th = _text_size(font, text)
+    return (int(x), int(y), int(math.ceil(x + tw)), int(math.ceil(y + th)))
+
+def _merge_rects(rects):
+    """Union overlapping boxes so no pixel is blended twice."""
+    merged = list(rects)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                a, b = merged[i], merged[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    merged[i] = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                    del merged[j]
+                    changed = True
+                    break
+            if changed:
+                break
+    return merged
+
 def _normalize_texts(label):
     if label is None:
         return []
@@ -127,7 +182,15 @@ def _normalize_texts(label):
         s = str(label).strip()
         return [s] if s else []
 
-def build_time_label(frame_index: int, pad_days: int, pad_hours: int) -> str:
+def time_label_format(pad_days: int, pad_hours: int) -> str:
+    """
+    TIME_LABEL_TEMPLATE as a str.format template (X -> {day}, Y -> {hour},
+    zero-padded), so each frame's label is a single format() call.
+    """
+    fmt = TIME_LABEL_TEMPLATE.replace("{", "{{").replace("}", "}}")
+    return fmt.replace("X", f"{{day:0{pad_days}d}}").replace("Y", f"{{hour:0{pad_hours}d}}")
+
+def build_time_label(frame_index: int, time_fmt: str) -> str:
     """
     Compute elapsed hours as float and round *only for display*.
     Never overwrite float values.
@@ -135,125 +198,310 @@ def build_time_label(frame_index: int, pad_days: int, pad_hours: int) -> str:
     elapsed_hours_float = (frame_index - 1) * HOURS_PER_FRAME
     elapsed_hours_display = int(round(elapsed_hours_float))
 
-    days = elapsed_hours_display // 24
-    hours = elapsed_hours_display % 24
-
-    day_str = str(days).zfill(pad_days)
-    hour_str = str(hours).zfill(pad_hours)
-
-    return TIME_LABEL_TEMPLATE.replace("X", day_str).replace("Y", hour_str)
+    days, hours = divmod(elapsed_hours_display, 24)
+    return time_fmt.format(day=days, hour=hours)
 
 # ===========================================================
 # New: overlay rendering and compositing that preserves bit depth
 # ===========================================================
 
-def render_text_overlay(size, tl, tr, bl, br, line_spacing=0):
-    """Create an 8-bit RGBA overlay image with all the text drawn on it."""
-    W, H = size
-    overlay = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
-
-    # TL
-    if tl and tl.get("texts"):
-        lh = _line_height(tl["font"])
-        x = tl["offset_x"]
-        y = tl["offset_y"]
-        for line in tl["texts"]:
-            draw.text((x, y), line, font=tl["font"], fill=tl["color"])
-            y += lh + line_spacing
-
-    # TR
-    if tr and tr.get("texts"):
-        lh = _line_height(tr["font"])
-        y = tr["offset_y"]
-        for line in tr["texts"]:
-            tw, _ = _text_size(tr["font"], line)
-            x = W - tw - tr["offset_x"]
-            draw.text((x, y), line, font=tr["font"], fill=tr["color"])
-            y += lh + line_spacing
-
-    # BL
-    if bl and bl.get("texts"):
-        lh = _line_height(bl["font"])
-        n = len(bl["texts"])
-        total_h = n * lh + line_spacing * (n - 1)
-        x = bl["offset_x"]
-        y = H - bl["offset_y"] - total_h
-        for line in bl["texts"]:
-            draw.text((x, y), line, font=bl["font"], fill=bl["color"])
-            y += lh + line_spacing
-
-    # BR
-    if br and br.get("texts"):
-        lh = _line_height(br["font"])
-        n = len(br["texts"])
-        total_h = n * lh + line_spacing * (n - 1)
-        y = H - br["offset_y"] - total_h
-        for line in br["texts"]:
-            tw, _ = _text_size(br["font"], line)
-            x = W - tw - br["offset_x"]
-            draw.text((x, y), line, font=br["font"], fill=br["color"])
-            y += lh + line_spacing
+# Per-corner constants; only the texts change from frame to frame
+# dynamic: the corner has a TIME or frame-number line, so its pixels change every frame
+CornerConfig = namedtuple("CornerConfig", "anchor font color offset_x offset_y dynamic")
+
+_CORNERS = None
+_CORNER_CACHE = {}
+
+# Reusable full-frame overlay, a Draw bound to it, and the boxes drawn on the last call
+_SCRATCH = {"overlay": None, "draw": None, "rects": []}
+
+def _is_dynamic(label):
+    return any(t == "TIME" or "`" in t for t in _normalize_texts(label))
+
+def get_corners():
+    """The four CornerConfigs (tl, tr, bl, br), built once per process."""
+    global _CORNERS
+    if _CORNERS is None:
+        _CORNERS = (
+            CornerConfig("tl", get_font(FONT_PATH_TL, FONT_SIZE_TL), FONT_COLOR_TL, OFFSET_X_TL, OFFSET_Y_TL,
+                         _is_dynamic(TEXT_LABEL_TL)),
+            CornerConfig("tr", get_font(FONT_PATH_TR, FONT_SIZE_TR), FONT_COLOR_TR, OFFSET_X_TR, OFFSET_Y_TR,
+                         _is_dynamic(TEXT_LABEL_TR)),
+            CornerConfig("bl", get_font(FONT_PATH_BL, FONT_SIZE_BL), FONT_COLOR_BL, OFFSET_X_BL, OFFSET_Y_BL,
+                         _is_dynamic(TEXT_LABEL_BL)),
+            CornerConfig("br", get_font(FONT_PATH_BR, FONT_SIZE_BR), FONT_COLOR_BR, OFFSET_X_BR, OFFSET_Y_BR,
+                         _is_dynamic(TEXT_LABEL_BR)),
+        )
+    return _CORNERS
 
-    return overlay
+def _layout_corner(corner, texts, size, line_spacing):
+    """Return [(x, y, line), ...] draw origins for one corner's lines."""
+    W, H = size
+    font = corner.font
+    lh = _line_height(font)
 
-def composite_preserve_bit_depth(base_img, overlay_rgba):
+    if corner.anchor[0] == "b":
+        n = len(texts)
+        total_h = n * lh + line_spacing * (n - 1)
+        y = H - corner.offset_y - total_h
+    else:
+        y = corner.offset_y
+
+    placed = []
+    for line in texts:
+        if corner.anchor[1] == "r":
+            tw, _ = _text_size(font, line)
+            x = W - tw - corner.offset_x
+        else:
+            x = corner.offset_x
+        placed.append((x, y, line))
+        y += lh + line_spacing
+    return placed
+
+def _render_corner(corner, texts, size, line_spacing):
+    """
+    Rasterize one corner's lines into a tight RGBA tile.
+    Returns (tile, (x0, y0)) with the tile's top-left position in the frame.
+    Cached on (anchor, size, texts): fonts, colors and offsets are constants here.
+    """
+    key = (corner.anchor, size, tuple(texts))
+    cached = _CORNER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    placed = _layout_corner(corner, texts, size, line_spacing)
+    boxes = [_line_bbox(corner.font, line, x, y) for x, y, line in placed]
+    x0 = min(b[0] for b in boxes)
+    y0 = min(b[1] for b in boxes)
+    x1 = max(b[2] for b in boxes)
+    y1 = max(b[3] for b in boxes)
+
+    tile = Image.new("RGBA", (max(x1 - x0, 1), max(y1 - y0, 1)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+    for x, y, line in placed:
+        draw.text((x - x0, y - y0), line, font=corner.font, fill=corner.color)
+
+    if len(_CORNER_CACHE) >= OVERLAY_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _CORNER_CACHE[next(iter(_CORNER_CACHE))]
+    _CORNER_CACHE[key] = (tile, (x0, y0))
+    return tile, (x0, y0)
+
+def render_text_overlay(size, texts_by_corner, line_spacing=0):
+    """
+    Create an 8-bit RGBA overlay image with all the text drawn on it.
+    texts_by_corner holds the line lists for (tl, tr, bl, br), matching get_corners().
+    Returns (overlay, dirty_rects): the boxes that hold every drawn glyph.
+    The overlay is a per-process scratch buffer reused by the next call, so use
+    it before rendering again; cached corner tiles are never mutated.
+
+    Static corners are pasted from cached tiles; dynamic corners are drawn
+    straight onto the scratch overlay with its persistent Draw.
+    """
+    W, H = size
+    overlay = _SCRATCH["overlay"]
+    if overlay is None or overlay.size != (W, H):
+        overlay = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+        _SCRATCH["overlay"] = overlay
+        _SCRATCH["draw"] = ImageDraw.Draw(overlay)
+    else:
+        # Only the previously drawn boxes are non-transparent
+        for rect in _SCRATCH["rects"]:
+            overlay.paste((0, 0, 0, 0), rect)
+    draw = _SCRATCH["draw"]
+    rects = []
+
+    for corner, texts in zip(get_corners(), texts_by_corner):
+        if not texts:
+            continue
+        if corner.dynamic:
+            boxes = []
+            for x, y, line in _layout_corner(corner, texts, size, line_spacing):
+                draw.text((x, y), line, font=corner.font, fill=corner.color)
+                boxes.append(_line_bbox(corner.font, line, x, y))
+            rects.append((min(b[0] for b in boxes), min(b[1] for b in boxes),
+                          max(b[2] for b in boxes), max(b[3] for b in boxes)))
+            continue
+        tile, (x0, y0) = _render_corner(corner, texts, size, line_spacing)
+        # alpha_composite needs a non-negative dest; trim anything off-frame
+        cx, cy = max(-x0, 0), max(-y0, 0)
+        if cx or cy:
+            tile = tile.crop((cx, cy, tile.width, tile.height))
+        overlay.alpha_composite(tile, dest=(x0 + cx, y0 + cy))
+        rects.append((x0, y0, x0 + tile.width + cx, y0 + tile.height + cy))
+
+    rects = _merge_rects(rects)
+    _SCRATCH["rects"] = rects
+    return overlay, rects
+
+def _blend_rgb(base_rgb, ov_rgba, dtype):
+    """
+    Fixed-point blend: out = (base*(max-a) + ov*a + max/2) // max.
+    uint16 intermediates suffice for 8-bit bases (255*255 + 127 < 2**16);
+    16-bit bases scale the overlay 0-255 -> 0-65535 and need uint32.
+    """
+    if dtype == np.uint16:
+        wide = np.uint32
+        max_val = 65535
+        a = ov_rgba[..., 3:4].astype(wide) * 257
+        ov_rgb = ov_rgba[..., :3].astype(wide) * 257
+    else:
+        wide = np.uint16
+        max_val = 255
+        a = ov_rgba[..., 3:4].astype(wide)
+        ov_rgb = ov_rgba[..., :3].astype(wide)
+
+    if not a.any():
+        return base_rgb
+    inv = wide(max_val) - a
+    out = (base_rgb.astype(wide) * inv + ov_rgb * a + max_val // 2) // max_val
+    return out.astype(dtype)
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _blend_rgb_inplace(region, ov_rgba, scale, max_val):
+        """
+        In-place version of _blend_rgb with the same fixed-point rounding.
+        Text overlays are almost all alpha 0 (skipped) or 255 (copied),
+        so only anti-aliased glyph edges pay for the blend. Serial on purpose:
+        it already runs once per pool worker, on small dirty rects.
+        """
+        half = max_val // 2
+        for y in range(region.shape[0]):
+            for x in range(region.shape[1]):
+                a = np.int64(ov_rgba[y, x, 3])
+                if a == 0:
+                    continue
+                if a == 255:
+                    for c in range(3):
+                        region[y, x, c] = np.int64(ov_rgba[y, x, c]) * scale
+                    continue
+                a *= scale
+                inv = max_val - a
+                for c in range(3):
+                    region[y, x, c] = (
+                        np.int64(region[y, x, c]) * inv
+                        + np.int64(ov_rgba[y, x, c]) * scale * a
+                        + half
+                    ) // max_val
+
+def _blend_region(region, ov_rgba, dtype):
+    """Blend an 8-bit RGBA overlay into an (h, w, 3) base view in place."""
+    if HAVE_NUMBA:
+        if dtype == np.uint16:
+            _blend_rgb_inplace(region, ov_rgba, 257, 65535)
+        else:
+            _blend_rgb_inplace(region, ov_rgba, 1, 255)
+    else:
+        region[...] = _blend_rgb(region, ov_rgba, dtype)
+
+def _clip_rects(dirty_rects, W, H):
+    """Clip (x0, y0, x1, y1) boxes to the frame, dropping empty ones."""
+    if dirty_rects is None:
+        return [(0, 0, W, H)]
+    out = []
+    for x0, y0, x1, y1 in dirty_rects:
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, W), min(y1, H)
+        if x0 < x1 and y0 < y1:
+            out.append((x0, y0, x1, y1))
+    return out
+
+def composite_preserve_bit_depth(base_img, overlay_rgba, dirty_rects=None):
     """
     Alpha-blend an 8-bit RGBA overlay onto base_img,
     preserving the base image's dtype (uint8 or uint16).
 
     - base_img: any Pillow image mode that numpy can convert (e.g. RGB, RGBA, I;16).
     - overlay_rgba: Pillow image in RGBA (uint8).
-    """
-    base_arr = np.array(base_img)
-    ov_arr = np.array(overlay_rgba)  # uint8 RGBA
+    - dirty_rects: optional (x0, y0, x1, y1) boxes that contain all non-transparent
+      overlay pixels; only those are blended. None blends the whole frame.
 
-    if base_arr.shape[0] != ov_arr.shape[0] or base_arr.shape[1] != ov_arr.shape[1]:
+    8-bit RGB and RGBA bases are patched IN PLACE, one dirty rect at a time, and
+    base_img itself is returned: no full-frame copies are made. L bases are
+    converted to RGB once and patched the same way. Other (16-bit) bases go
+    through a full NumPy copy.
+    """
+    if base_img.size != overlay_rgba.size:
         raise ValueError("Base and overlay sizes do not match")
+    W, H = base_img.size
+    rects = _clip_rects(dirty_rects, W, H)
+
+    if base_img.mode in ("RGB", "L"):
+        out = base_img if base_img.mode == "RGB" else base_img.convert("RGB")
+        for box in rects:
+            patch = out.crop(box).convert("RGBA")
+            patch.alpha_composite(overlay_rgba, source=box)
+            out.paste(patch.convert("RGB"), box[:2])
+        return out
+
+    if base_img.mode == "RGBA":
+        # Blend RGB only; the base alpha is left untouched
+        for box in rects:
+            region = np.array(base_img.crop(box))
+            _blend_region(region[..., :3], np.asarray(overlay_rgba.crop(box)), np.uint8)
+            base_img.paste(Image.fromarray(region, "RGBA"), box[:2])
+        return base_img
+
+    base_arr = np.array(base_img)
+    ov_arr = np.asarray(overlay_rgba)  # uint8 RGBA
 
     # Ensure base has channel dimension
     if base_arr.ndim == 2:
         # Grayscale -> treat as RGB for compositing
         base_arr = np.stack([base_arr] * 3, axis=-1)
 
-    # Split channels
-    ov_rgb = ov_arr[..., :3].astype(np.float32)
-    ov_a = ov_arr[..., 3:4].astype(np.float32)  # keep extra dim
+    # base_arr is already a private copy: blend RGB in place, alpha (if any) untouched
+    for x0, y0, x1, y1 in rects:
+        _blend_region(base_arr[y0:y1, x0:x1, :3], ov_arr[y0:y1, x0:x1], base_arr.dtype)
 
-    # Prepare base rgb
-    base_has_alpha = (base_arr.ndim == 3 and base_arr.shape[2] == 4)
-    if base_has_alpha:
-        base_rgb = base_arr[..., :3].astype(np.float32)
-        base_alpha_channel = base_arr[..., 3:4]  # preserved unchanged
-    else:
-        base_rgb = base_arr.astype(np.float32)
+    return Image.fromarray(base_arr)
 
-    # Scale overlay RGB up if base is 16-bit
-    if base_arr.dtype == np.uint16:
-        # 0-255 -> 0-65535
-        ov_rgb = ov_rgb * 257.0
-        max_val = 65535.0
-    else:
-        max_val = 255.0
+# ===========================================================
 
-    alpha = ov_a / 255.0  # 0..1
-    alpha_rgb = alpha  # shape (H, W, 1)
+def process_one(src, idx, total, pad_width, time_fmt, out_dir):
+    """Overlay one frame and write it to out_dir. Returns the output path."""
+    with Image.open(src) as im:
+        frame_str = str(idx).zfill(pad_width)
+
+        def replace_tokens(s):
+            return s.replace("`", frame_str).replace("^", str(total))
+
+        def process_label(label):
+            out = []
+            for t in _normalize_texts(label):
+                if t == "TIME":
+                    out.append(build_time_label(idx, time_fmt))
+                else:
+                    out.append(replace_tokens(t))
+            return out
+
+        texts_by_corner = (
+            process_label(TEXT_LABEL_TL),
+            process_label(TEXT_LABEL_TR),
+            process_label(TEXT_LABEL_BL),
+            process_label(TEXT_LABEL_BR),
+        )
 
-    out_rgb = (1.0 - alpha_rgb) * base_rgb + alpha_rgb * ov_rgb
-    out_rgb = np.clip(out_rgb, 0, max_val)
+        overlay_img, dirty_rects = render_text_overlay(im.size, texts_by_corner, LINE_SPACING)
 
-    # Reassemble output array, preserving dtype & alpha channel if present
-    if base_has_alpha:
-        out = np.concatenate(
-            [out_rgb.astype(base_arr.dtype), base_alpha_channel[..., :1]],
-            axis=-1,
-        )
-    else:
-        out = out_rgb.astype(base_arr.dtype)
+        result = composite_preserve_bit_depth(im, overlay_img, dirty_rects)
 
-    return Image.fromarray(out)
+        save_kwargs = {"compress_level": PNG_COMPRESS_LEVEL}
+        if "dpi" in im.info:
+            save_kwargs["dpi"] = im.info["dpi"]
 
-# ===========================================================
+        dst = out_dir / src.name
+        result.save(dst, format="PNG", **save_kwargs)
+    return dst
+
+def _process_one_safe(args):
+    """process_one for executor.map: report failures instead of raising."""
+    src = args[0]
+    try:
+        return src, process_one(*args), None
+    except Exception as e:
+        return src, None, e
 
 def main():
     parser = argparse.ArgumentParser(description="Add corner overlays to PNGs in a folder.")
@@ -268,7 +516,9 @@ def main():
     out_dir = in_dir.parent / f"{in_dir.name}-overlay"
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    pngs = sorted([p for p in in_dir.iterdir() if p.suffix.lower() == ".png"])
+    with os.scandir(in_dir) as it:
+        names = sorted(e.name for e in it if e.is_file() and e.name.lower().endswith(".png"))
+    pngs = [in_dir / name for name in names]
     total = len(pngs)
     if total == 0:
         print(f"[info] No PNGs found.")
@@ -276,11 +526,6 @@ def main():
 
     pad_width = len(str(total))
 
-    font_tl = load_font(FONT_PATH_TL, FONT_SIZE_TL)
-    font_tr = load_font(FONT_PATH_TR, FONT_SIZE_TR)
-    font_bl = load_font(FONT_PATH_BL, FONT_SIZE_BL)
-    font_br = load_font(FONT_PATH_BR, FONT_SIZE_BR)
-
     # Compute padding based on *display-rounded* max time
     max_elapsed_hours_float = (total - 1) * HOURS_PER_FRAME
     max_elapsed_hours_display = int(round(max_elapsed_hours_float))
@@ -289,55 +534,17 @@ def main():
     pad_days = max(len(str(max_days)), 1)
     pad_hours = max(len(str(max_hours)), 1)
     pad_hours = 2
-
-    for idx, src in enumerate(pngs, 1):
-        try:
-            with Image.open(src) as im:
-                frame_str = str(idx).zfill(pad_width)
-
-                def replace_tokens(s):
-                    return s.replace("`", frame_str).replace("^", str(total))
-
-                def process_label(label):
-                    out = []
-                    for t in _normalize_texts(label):
-                        if t == "TIME":
-                            out.append(build_time_label(idx, pad_days, pad_hours))
-                        else:
-                            out.append(replace_tokens(t))
-                    return out
-
-                tl_texts = process_label(TEXT_LABEL_TL)
-                tr_texts = process_label(TEXT_LABEL_TR)
-                bl_texts = process_label(TEXT_LABEL_BL)
-                br_texts = process_label(TEXT_LABEL_BR)
-
-                overlay_img = render_text_overlay(
-                    im.size,
-                    tl={"texts": tl_texts, "font": font_tl, "color": FONT_COLOR_TL,
-                        "offset_x": OFFSET_X_TL, "offset_y": OFFSET_Y_TL},
-                    tr={"texts": tr_texts, "font": font_tr, "color": FONT_COLOR_TR,
-                        "offset_x": OFFSET_X_TR, "offset_y": OFFSET_Y_TR},
-                    bl={"texts": bl_texts, "font": font_bl, "color": FONT_COLOR_BL,
-                        "offset_x": OFFSET_X_BL, "offset_y": OFFSET_Y_BL},
-                    br={"texts": br_texts, "font": font_br, "color": FONT_COLOR_BR,
-                        "offset_x": OFFSET_X_BR, "offset_y": OFFSET_Y_BR},
-                    line_spacing=LINE_SPACING,
-                )
-
-                result = composite_preserve_bit_depth(im, overlay_img)
-
-                save_kwargs = {}
-                if "dpi" in im.info:
-                    save_kwargs["dpi"] = im.info["dpi"]
-
-                dst = out_dir / src.name
-                result.save(dst, format="PNG", **save_kwargs)
-
-            print(f"[{idx}/{total}] {src.name} -> {dst}")
-
-        except Exception as e:
-            print(f"[error] Failed on {src.name}: {e}")
+    time_fmt = time_label_format(pad_days, pad_hours)
+
+    # Frames are independent, so fan them out across processes
+    tasks = [(src, idx, total, pad_width, time_fmt, out_dir)
+             for idx, src in enumerate(pngs, 1)]
+    with ProcessPoolExecutor(max_workers=WORKERS) as executor:
+        for idx, (src, dst, err) in enumerate(executor.map(_process_one_safe, tasks), 1):
+            if err is not None:
+                print(f"[error] Failed on {src.name}: {err}")
+            else:
+                print(f"[{idx}/{total}] {src.name} -> {dst}")
 
     print(f"[done] Wrote {total} files to {out_dir}")
 
@@ -3,7 +3,29 @@ import os
 import sys
 import argparse
 import math
-from PIL import Image, ImageOps
+import queue
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+# Optional: libspng-backed PNG decoding (falls back to Pillow)
+try:
+    import pyspng
+    HAVE_PYSPNG = True
+except ImportError:
+    HAVE_PYSPNG = False
+
+# Optional: JIT-compiled closing-stage marker kernel (falls back to NumPy)
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
 # ==========================
 # CONFIGURABLE PARAMETERS
@@ -47,6 +69,19 @@ PADDING_COLOR_RGB = (0, 0, 0)  # black
 # Safety cap for stage 2 (avoid infinite loops)
 MAX_FRAMES_STAGE2 = 5000
 
+# PNG zlib level for output frames: 1 encodes ~5x faster than Pillow's default 6.
+# Set ECDOSIM_PNG_LEVEL=9 for a final release encode.
+PNG_COMPRESS_LEVEL = int(os.environ.get("ECDOSIM_PNG_LEVEL", 1))
+
+# Worker processes for the original sequence (frames there are independent)
+WORKERS = os.cpu_count() or 1
+
+# Reverse-sequence input frames decoded ahead of the writer
+PREFETCH_DEPTH = 8
+
+# Decoded frames kept in memory for the reverse zig-zag (~14 MB each at 2528x1422)
+FRAME_CACHE_SIZE = 16
+
 
 # ==========================
 # HELPER FUNCTIONS
@@ -57,7 +92,8 @@ def debug(msg: str):
 
 
 def list_input_frames(input_dir):
-    files = [f for f in os.listdir(input_dir) if f.lower().endswith(".png")]
+    with os.scandir(input_dir) as it:
+        files = [e.name for e in it if e.is_file() and e.name.lower().endswith(".png")]
     if not files:
         raise RuntimeError(f"No PNG files found in {input_dir}")
 
@@ -80,33 +116,85 @@ def ensure_output_dir(input_dir):
     return out_dir
 
 
-def preprocess_image(img: Image.Image) -> Image.Image:
+def decode_frame(path: str) -> np.ndarray:
+    """Decode a PNG to an (H, W, 3 or 4) uint8 array, via pyspng when available."""
+    if HAVE_PYSPNG:
+        with open(path, "rb") as f:
+            arr = pyspng.load(f.read())
+        if arr.dtype == np.uint8 and arr.ndim == 3 and arr.shape[2] in (3, 4):
+            return arr
+        # 16-bit, grayscale, etc.: let Pillow convert
+    with Image.open(path) as img:
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+        return np.asarray(img)
+
+
+# Per-process padded canvases for preprocess_image(reuse=True), keyed by cropped size
+_CANVASES = {}
+
+
+def preprocess_image(arr: np.ndarray, reuse: bool = False) -> Image.Image:
     """
     Crop left/right to 2528px, pad top/bottom to 1422px, convert to RGBA.
+    Takes a decode_frame array; the cropped rows are copied once into a
+    preallocated padded canvas (RGB inputs get their alpha filled there).
+
+    reuse=True writes into one persistent canvas whose padding is filled only
+    once. The returned image shares that buffer, so it is only valid until
+    the next reuse=True call in this process.
     """
-    img = img.convert("RGBA")
-    w, h = img.size
+    h, w = arr.shape[:2]
 
-    # Crop sides
-    left = CROP_LEFT
-    right = w - CROP_RIGHT
-    img = img.crop((left, 0, right, h))
+    # Crop sides (a view, no copy)
+    cropped = arr[:, CROP_LEFT:w - CROP_RIGHT]
 
     # Pad top/bottom
-    w2, h2 = img.size
+    h2, w2 = cropped.shape[:2]
     pad_total = TARGET_HEIGHT - h2
     if pad_total < 0:
         raise RuntimeError(f"TARGET_HEIGHT ({TARGET_HEIGHT}) smaller than cropped height ({h2}).")
     pad_top = pad_total // 2
-    pad_bottom = pad_total - pad_top
 
-    fill = (*PADDING_COLOR_RGB, 255)
-    img = ImageOps.expand(img, border=(0, pad_top, 0, pad_bottom), fill=fill)
-    return img
+    out = _CANVASES.get((h2, w2)) if reuse else None
+    if out is None:
+        fill = (*PADDING_COLOR_RGB, 255)
+        out = np.empty((TARGET_HEIGHT, w2, 4), dtype=np.uint8)
+        out[:pad_top] = fill
+        out[pad_top + h2:] = fill
+        if reuse:
+            _CANVASES[(h2, w2)] = out
+    out[pad_top:pad_top + h2, :, :cropped.shape[2]] = cropped
+    if cropped.shape[2] == 3:
+        out[pad_top:pad_top + h2, :, 3] = 255
+    return Image.fromarray(out, "RGBA")
+
+
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def load_preprocessed_frame(frame_path: str) -> Image.Image:
+    """Decode + preprocess a frame, memoized; callers must not mutate the result."""
+    return preprocess_image(decode_frame(frame_path))
 
 
-def load_preprocessed_frame(frame_path: str) -> Image.Image:
-    return preprocess_image(Image.open(frame_path))
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def load_brightened_frame(frame_path: str, factor: float) -> Image.Image:
+    """load_preprocessed_frame brightened toward white, memoized per (path, factor)."""
+    return brighten_to_white_factor(load_preprocessed_frame(frame_path), factor)
+
+
+# Image.point tables, keyed by (kind, factor): R, G, B mapped, alpha identity
+_POINT_TABLES = {}
+
+
+def _apply_rgb_lut(img: Image.Image, lut: np.ndarray, key) -> Image.Image:
+    """Map R, G, B through a 256-entry uint8 table in one C pass; alpha is preserved."""
+    table = _POINT_TABLES.get(key)
+    if table is None:
+        table = lut.tolist() * 3 + list(range(256))
+        _POINT_TABLES[key] = table
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    return img.point(table)
 
 
 def brighten_to_white_factor(img: Image.Image, factor: float) -> Image.Image:
@@ -116,16 +204,9 @@ def brighten_to_white_factor(img: Image.Image, factor: float) -> Image.Image:
     factor=0.5 → halfway to white
     factor=1.0 → full white
     """
-    img = img.convert("RGBA")
-    r, g, b, a = img.split()
-
-    def mix_with_white(channel):
-        return channel.point(lambda v: int(v * (1 - factor) + 255 * factor))
-
-    r = mix_with_white(r)
-    g = mix_with_white(g)
-    b = mix_with_white(b)
-    return Image.merge("RGBA", (r, g, b, a))
+    # Same truncating int(v * (1 - factor) + 255 * factor) as before, once per value
+    lut = (np.arange(256, dtype=np.float64) * (1 - factor) + 255 * factor).astype(np.uint8)
+    return _apply_rgb_lut(img, lut, ("brighten", factor))
 
 
 def darken_image_rgb(img: Image.Image, factor: float) -> Image.Image:
@@ -133,16 +214,80 @@ def darken_image_rgb(img: Image.Image, factor: float) -> Image.Image:
     Darken RGB toward black by factor (1.0 = original, 0.5 = halfway to black).
     Alpha is preserved.
     """
-    img = img.convert("RGBA")
-    r, g, b, a = img.split()
-    r = r.point(lambda v: int(v * factor))
-    g = g.point(lambda v: int(v * factor))
-    b = b.point(lambda v: int(v * factor))
-    return Image.merge("RGBA", (r, g, b, a))
+    return _apply_rgb_lut(img, _darken_lut(factor), ("darken", factor))
+
+
+def _darken_lut(factor: float) -> np.ndarray:
+    return (np.arange(256, dtype=np.float64) * factor).astype(np.uint8)
+
+
+def frame_path(out_dir: str, frame_index: int) -> str:
+    return os.path.join(out_dir, f"{frame_index:04d}.png")
 
 
 def save_frame(img: Image.Image, out_dir: str, frame_index: int):
-    img.save(os.path.join(out_dir, f"{frame_index:04d}.png"), format="PNG")
+    img.save(frame_path(out_dir, frame_index), format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+
+
+def copy_frame(out_dir: str, src_index: int, frame_index: int):
+    """Duplicate an already-written output frame without re-encoding it."""
+    shutil.copyfile(frame_path(out_dir, src_index), frame_path(out_dir, frame_index))
+
+
+def prefetch(func, args_list, depth=PREFETCH_DEPTH):
+    """
+    Yield func(*args) for each args in order, keeping up to `depth` calls
+    running ahead on threads (PNG decode and Pillow ops release the GIL).
+    """
+    with ThreadPoolExecutor(max_workers=depth) as executor:
+        pending = deque()
+        for args in args_list:
+            pending.append(executor.submit(func, *args))
+            if len(pending) >= depth:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def start_writer():
+    """
+    Start a background thread that runs queued (func, args) frame writes in
+    order, so PNG encoding overlaps the next frame's decode and compute.
+    """
+    jobs = queue.Queue(maxsize=2)
+    errors = []
+
+    def worker():
+        while True:
+            job = jobs.get()
+            try:
+                if job is None:
+                    return
+                if not errors:
+                    func, args = job
+                    func(*args)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                jobs.task_done()
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return {"jobs": jobs, "thread": thread, "errors": errors}
+
+
+def stop_writer(writer):
+    """Wait for all queued writes, re-raising the first failure."""
+    writer["jobs"].put(None)
+    writer["thread"].join()
+    if writer["errors"]:
+        raise writer["errors"][0]
+
+
+def _write_array_frame(args):
+    """Pool worker: encode one RGBA array snapshot as an output frame."""
+    arr, out_dir, frame_index = args
+    save_frame(Image.fromarray(arr, "RGBA"), out_dir, frame_index)
 
 
 def generate_reverse_stage2_indices(max_index: int, stage2_frames: int, start_index: int = None):
@@ -223,80 +368,141 @@ def run_reverse_sequence(input_paths, out_dir, start_frame_index):
 
     debug(f"\n[Reverse] Using seed frame {seed_frame_idx} (of {num_input})")
 
-    # Stage 1: hold seed frame, brightened toward white
     frames_stage1 = int(FPS * REVERSE_STAGE1_MULT)
+    frames_stage2 = int(FPS * REVERSE_STAGE2_MULT)
+    frames_stage3 = int(FPS * REVERSE_STAGE3_MULT)
+
+    # Only use frames 1..seed_frame_idx in the zig-zag
+    indices = []
+    if frames_stage2 > 0:
+        indices = generate_reverse_stage2_indices(
+            max_index=seed_frame_idx,
+            stage2_frames=frames_stage2,
+            start_index=seed_frame_idx,
+        )
+
+    # Every reverse frame is a brightened input frame, and inputs repeat a lot
+    # (holds, zig-zag revisits). Encode each input once, then copy the file.
+    # Writes go through one ordered writer thread, so a copy always follows
+    # the save it duplicates.
+    written = {}  # input frame index -> output frame index holding it
+    writer = start_writer()
+
+    # The full input order is known up front, so decode + brighten the
+    # distinct inputs ahead of time, in the order emit will ask for them.
+    order = [seed_frame_idx] * frames_stage1 + list(indices) + [1] * frames_stage3
+    first_seen = list(dict.fromkeys(order))
+    frames = prefetch(
+        load_brightened_frame,
+        [(input_paths[i - 1], REVERSE_BRIGHTEN_FACTOR) for i in first_seen],
+    )
+
+    def emit(inp_idx, out_idx):
+        if inp_idx in written:
+            writer["jobs"].put((copy_frame, (out_dir, written[inp_idx], out_idx)))
+        else:
+            img = next(frames)
+            writer["jobs"].put((save_frame, (img, out_dir, out_idx)))
+            written[inp_idx] = out_idx
+
+    # Stage 1: hold seed frame, brightened toward white
     if frames_stage1 > 0:
         debug(
             f"=== Reverse Stage 1 (brighten seed frame {seed_frame_idx}, "
             f"{REVERSE_BRIGHTEN_FACTOR*100:.0f}% to white) - {frames_stage1} frames ==="
         )
-        img_seed = brighten_to_white_factor(
-            load_preprocessed_frame(input_paths[seed_frame_idx - 1]),
-            REVERSE_BRIGHTEN_FACTOR,
-        )
         for _ in range(frames_stage1):
-            save_frame(img_seed, out_dir, idx)
+            emit(seed_frame_idx, idx)
             debug(f"  Reverse Stage 1 - output {idx:04d} from input frame {seed_frame_idx}")
             idx += 1
 
     # Stage 2: reverse zig-zag from seed down toward first frame, brightened
-    frames_stage2 = int(FPS * REVERSE_STAGE2_MULT)
     if frames_stage2 > 0:
         debug(
             f"\n=== Reverse Stage 2 (brightened zig-zag from seed {seed_frame_idx} to 1) "
             f"- {frames_stage2} frames ==="
         )
-        # Only use frames 1..seed_frame_idx in the zig-zag
-        indices = generate_reverse_stage2_indices(
-            max_index=seed_frame_idx,
-            stage2_frames=frames_stage2,
-            start_index=seed_frame_idx,
-        )
         for inp_idx in indices:
-            img = brighten_to_white_factor(
-                load_preprocessed_frame(input_paths[inp_idx - 1]),
-                REVERSE_BRIGHTEN_FACTOR,
-            )
-            save_frame(img, out_dir, idx)
+            emit(inp_idx, idx)
             debug(f"  Reverse Stage 2 - output {idx:04d} from input frame {inp_idx}")
             idx += 1
 
     # Stage 3: hold first frame, brightened toward white (unchanged)
-    frames_stage3 = int(FPS * REVERSE_STAGE3_MULT)
     if frames_stage3 > 0:
         debug(
             f"\n=== Reverse Stage 3 (brighten first frame, {REVERSE_BRIGHTEN_FACTOR*100:.0f}% to white) "
             f"- {frames_stage3} frames ==="
         )
-        img_first = brighten_to_white_factor(
-            load_preprocessed_frame(input_paths[0]),
-            REVERSE_BRIGHTEN_FACTOR,
-        )
         for _ in range(frames_stage3):
-            save_frame(img_first, out_dir, idx)
+            emit(1, idx)
             debug(f"  Reverse Stage 3 - output {idx:04d} from input frame 1")
             idx += 1
 
+    stop_writer(writer)
     return idx
 
 
+def _write_original_frame(args):
+    path, out_dir, frame_index = args
+    # Each frame is used once and saved before the next one is built here,
+    # so skip the (per-process) frame cache and reuse one padded canvas
+    save_frame(preprocess_image(decode_frame(path), reuse=True), out_dir, frame_index)
+    return frame_index
+
+
 def run_original_sequence(input_paths, out_dir, start_frame_index):
-    idx = start_frame_index
     debug(f"\n=== Original Sequence (unaltered frames) - {len(input_paths)} frames ===")
-    for i, path in enumerate(input_paths, start=1):
-        img = load_preprocessed_frame(path)
-        save_frame(img, out_dir, idx)
-        debug(f"  Original - output {idx:04d} from input frame {i}")
-        idx += 1
-    return idx
+    # No cross-frame state here, unlike the reverse/closing stages, so fan out
+    tasks = [(path, out_dir, start_frame_index + i) for i, path in enumerate(input_paths)]
+    with ProcessPoolExecutor(max_workers=WORKERS) as executor:
+        for i, idx in enumerate(executor.map(_write_original_frame, tasks), start=1):
+            debug(f"  Original - output {idx:04d} from input frame {i}")
+    return start_frame_index + len(input_paths)
+
 
+def nonwhite_mask(arr: np.ndarray) -> np.ndarray:
+    """Boolean (H, W) mask of pixels whose RGB is not pure white."""
+    rgb = arr[..., :3]
+    return ~((rgb[..., 0] == 255) & (rgb[..., 1] == 255) & (rgb[..., 2] == 255))
 
-def whiten_pixel_if_needed(px, x, y, w, h, remaining_ref):
-    if 0 <= x < w and 0 <= y < h:
-        r, g, b, a = px[x, y]
-        if not (r == 255 and g == 255 and b == 255):
-            px[x, y] = (255, 255, 255, a)
-            remaining_ref[0] -= 1
+
+def whiten_pixels(arr: np.ndarray, nonwhite: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> int:
+    """
+    Whiten RGB (alpha kept) at integer pixel coords (xs, ys), ignoring
+    out-of-bounds and duplicate coords. Updates nonwhite in place and
+    returns how many pixels were newly whitened.
+    """
+    h, w = nonwhite.shape
+    inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    flat = ys[inside] * w + xs[inside]
+    nonwhite_flat = nonwhite.reshape(-1)
+    # Drop already-white pixels before deduplicating: late in stage 2 most of
+    # the band is white, so this keeps the sort in np.unique small
+    hit = np.unique(flat[nonwhite_flat[flat]])
+    nonwhite_flat[hit] = False
+    arr.reshape(-1, 4)[hit, :3] = 255
+    return int(hit.size)
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def paint_marker(arr, nonwhite, cx, cy, dx_dir, dy_dir, perp_dx, perp_dy, steps, max_offset):
+        """
+        Whiten every in-bounds pixel of the (steps x thickness) marker band in place,
+        without allocating. Same sampling and rounding as the NumPy grid path.
+        """
+        h, w = nonwhite.shape
+        for s in prange(steps):
+            bx = cx + dx_dir * s
+            by = cy + dy_dir * s
+            for offset_step in range(-max_offset, max_offset + 1):
+                x = int(np.rint(bx + perp_dx * offset_step))
+                y = int(np.rint(by + perp_dy * offset_step))
+                if 0 <= x < w and 0 <= y < h and nonwhite[y, x]:
+                    nonwhite[y, x] = False
+                    arr[y, x, 0] = 255
+                    arr[y, x, 1] = 255
+                    arr[y, x, 2] = 255
 
 
 def run_closing_sequence(input_paths, out_dir, start_frame_index):
@@ -309,98 +515,116 @@ def run_closing_sequence(input_paths, out_dir, start_frame_index):
     frames_stage1 = int(FPS * CLOSING_STAGE1_MULT)
     if frames_stage1 > 0:
         debug(f"\n=== Closing Stage 1 (darken last frame toward black) - {frames_stage1} frames ===")
+        writer = start_writer()
         for i in range(frames_stage1):
             t = i / (frames_stage1 - 1) if frames_stage1 > 1 else 0.0
             factor = 1.0 - 0.5 * t
             img = darken_image_rgb(base_last, factor)
-            save_frame(img, out_dir, idx)
+            writer["jobs"].put((save_frame, (img, out_dir, idx)))
             debug(f"  Closing Stage 1 - output {idx:04d} from input frame {num_input} (factor={factor:.3f})")
             idx += 1
+        stop_writer(writer)
 
     # Stage 2: rotating, growing radius marker, whitening pixels
     debug(f"\n=== Closing Stage 2 (rotating radius marker to full white) ===")
 
-    img = darken_image_rgb(base_last, 0.5)
-    px = img.load()
-    w, h = img.size
-
-    # Count non-white pixels
-    remaining = 0
-    for y in range(h):
-        for x in range(w):
-            r, g, b, a = px[x, y]
-            if not (r == 255 and g == 255 and b == 255):
-                remaining += 1
-    remaining_ref = [remaining]
-
-    cx, cy = w // 2, h // 2
-
-    # First frame: center 2x2 white
-    for dy in [0, 1]:
-        for dx in [0, 1]:
-            whiten_pixel_if_needed(px, cx - 1 + dx, cy - 1 + dy, w, h, remaining_ref)
-
-    save_frame(img, out_dir, idx)
-    debug(
-        f"  Closing Stage 2 - output {idx:04d} (center 2x2 white, remaining={remaining_ref[0]})"
-    )
-    idx += 1
-
-    # Precompute max radius = image diagonal, to clamp radius
-    max_radius = math.hypot(w, h)
-
-    frame_in_stage2 = 1
-    while remaining_ref[0] > 0 and frame_in_stage2 < MAX_FRAMES_STAGE2:
-        # Compute angle, direction, and perpendicular
-        angle_deg = -ANGLE_DEGREES_PER_FRAME * frame_in_stage2  # clockwise
-        angle_rad = math.radians(angle_deg)
-        dx_dir = math.cos(angle_rad)
-        dy_dir = math.sin(angle_rad)
-        perp_dx = -dy_dir
-        perp_dy = dx_dir
-
-        # Exponential radius and thickness growth
-        raw_radius = BASE_RADIUS_PER_FRAME * frame_in_stage2 * (RADIUS_RADIUS_MULTIPLIER ** frame_in_stage2)
-        radius = min(raw_radius, max_radius)   # CLAMPED TO DIAGONAL
-        thickness = BASE_THICKNESS * (RADIUS_THICKNESS_MULTIPLIER ** frame_in_stage2)
-
-        steps = max(int(radius), 1)
-        half_t = thickness / 2.0
-        max_offset = max(1, int(math.ceil(half_t)))
-
-        for s in range(steps):
-            bx = cx + dx_dir * s
-            by = cy + dy_dir * s
-
-            # Sample ALL integer offsets across thickness band
-            for offset_step in range(-max_offset, max_offset + 1):
-                offset = float(offset_step)
-                x = int(round(bx + perp_dx * offset))
-                y = int(round(by + perp_dy * offset))
-                whiten_pixel_if_needed(px, x, y, w, h, remaining_ref)
-
-        save_frame(img, out_dir, idx)
-        debug(
-            f"  Closing Stage 2 - output {idx:04d} (n={frame_in_stage2}, radius={radius:.2f}, "
-            f"thickness={thickness:.2f}, angle={angle_deg:.1f}°, remaining={remaining_ref[0]})"
+    # Painting is serial (each frame builds on the last), but the PNG encodes
+    # of its snapshots are independent, so they run on a process pool.
+    with ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        pending = deque()
+
+        def emit(frame_index):
+            pending.append(pool.submit(_write_array_frame, (arr.copy(), out_dir, frame_index)))
+            # Bound the snapshots held in flight
+            while len(pending) > 2 * WORKERS:
+                pending.popleft().result()
+
+        # Hold the frame as an (H, W, 4) array plus a live mask of non-white pixels,
+        # darkening straight into the array rather than via an intermediate image
+        arr = np.array(base_last)
+        arr[..., :3] = _darken_lut(0.5)[arr[..., :3]]
+        h, w = arr.shape[:2]
+        nonwhite = nonwhite_mask(arr)
+
+        # Count non-white pixels
+        remaining = int(np.count_nonzero(nonwhite))
+
+        cx, cy = w // 2, h // 2
+
+        # First frame: center 2x2 white
+        remaining -= whiten_pixels(
+            arr, nonwhite,
+            np.array([cx - 1, cx, cx - 1, cx]),
+            np.array([cy - 1, cy - 1, cy, cy]),
         )
-        idx += 1
-        frame_in_stage2 += 1
 
-    # Force full white if still not done (safety)
-    if remaining_ref[0] > 0:
+        emit(idx)
         debug(
-            f"  [warn] Closing Stage 2 hit safety cap with {remaining_ref[0]} pixels left, forcing full white."
+            f"  Closing Stage 2 - output {idx:04d} (center 2x2 white, remaining={remaining})"
         )
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = px[x, y]
-                if not (r == 255 and g == 255 and b == 255):
-                    px[x, y] = (255, 255, 255, a)
-        save_frame(img, out_dir, idx)
-        debug(f"  Closing Stage 2 - output {idx:04d} (forced full white)")
         idx += 1
 
+        # Precompute max radius = image diagonal, to clamp radius
+        max_radius = math.hypot(w, h)
+
+        frame_in_stage2 = 1
+        while remaining > 0 and frame_in_stage2 < MAX_FRAMES_STAGE2:
+            # Compute angle, direction, and perpendicular
+            angle_deg = -ANGLE_DEGREES_PER_FRAME * frame_in_stage2  # clockwise
+            angle_rad = math.radians(angle_deg)
+            dx_dir = math.cos(angle_rad)
+            dy_dir = math.sin(angle_rad)
+            perp_dx = -dy_dir
+            perp_dy = dx_dir
+
+            # Exponential radius and thickness growth
+            raw_radius = BASE_RADIUS_PER_FRAME * frame_in_stage2 * (RADIUS_RADIUS_MULTIPLIER ** frame_in_stage2)
+            radius = min(raw_radius, max_radius)   # CLAMPED TO DIAGONAL
+            thickness = BASE_THICKNESS * (RADIUS_THICKNESS_MULTIPLIER ** frame_in_stage2)
+
+            steps = max(int(radius), 1)
+            half_t = thickness / 2.0
+            max_offset = max(1, int(math.ceil(half_t)))
+
+            if HAVE_NUMBA:
+                paint_marker(arr, nonwhite, cx, cy, dx_dir, dy_dir, perp_dx, perp_dy, steps, max_offset)
+                # Parallel band rows may overlap, so recount rather than decrement
+                remaining = int(np.count_nonzero(nonwhite))
+            else:
+                # Sample ALL integer offsets across thickness band, for every step at once:
+                # a (steps, 2*max_offset+1) grid of band positions
+                s = np.arange(steps, dtype=np.float64)
+                offsets = np.arange(-max_offset, max_offset + 1, dtype=np.float64)
+                bx = cx + dx_dir * s
+                by = cy + dy_dir * s
+                xs = np.rint(bx[:, None] + perp_dx * offsets[None, :]).astype(np.int64)
+                ys = np.rint(by[:, None] + perp_dy * offsets[None, :]).astype(np.int64)
+                remaining -= whiten_pixels(arr, nonwhite, xs.ravel(), ys.ravel())
+
+            emit(idx)
+            debug(
+                f"  Closing Stage 2 - output {idx:04d} (n={frame_in_stage2}, radius={radius:.2f}, "
+                f"thickness={thickness:.2f}, angle={angle_deg:.1f}°, remaining={remaining})"
+            )
+            idx += 1
+            frame_in_stage2 += 1
+
+        # Force full white if still not done (safety)
+        if remaining > 0:
+            debug(
+                f"  [warn] Closing Stage 2 hit safety cap with {remaining} pixels left, forcing full white."
+            )
+            # Every pixel ends white, so one plain store beats a masked scatter
+            arr[..., :3] = 255
+            nonwhite[...] = False
+            remaining = 0
+            emit(idx)
+            debug(f"  Closing Stage 2 - output {idx:04d} (forced full white)")
+            idx += 1
+
+        for fut in pending:
+            fut.result()
+
     return idx
 
 
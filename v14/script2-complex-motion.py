@@ -1,5 +1,6 @@
 import bpy
 import math
+import numpy as np
 from mathutils import Quaternion, Vector, Euler
 
 # -----------------------
@@ -14,6 +15,9 @@ VORTEX_DYN_NAME = "Vortex-dynamic"
 # Choose an Euler order to use when writing rotations
 EULER_ORDER = 'XYZ'
 
+# Print the per-frame breakdown (set False to skip the formatting on long ranges)
+PRINT_FRAMES = True
+
 # -----------------------
 # HELPERS
 # -----------------------
@@ -29,18 +33,24 @@ def get_action_frame_range_from_object(obj: bpy.types.Object):
         raise RuntimeError(f"Object '{obj.name}' has no animation action/keyframes.")
     action = ad.action
 
-    frames = []
+    # One foreach_get per F-curve instead of a Python read per keyframe
+    fmin = fmax = None
     for fc in action.fcurves:
-        for kp in fc.keyframe_points:
-            frames.append(kp.co.x)
-
-    if not frames:
+        n = len(fc.keyframe_points)
+        if not n:
+            continue
+        co = np.empty(n * 2, dtype=np.float32)
+        fc.keyframe_points.foreach_get("co", co)
+        xs = co[0::2]
+        lo, hi = float(xs.min()), float(xs.max())
+        fmin = lo if fmin is None else min(fmin, lo)
+        fmax = hi if fmax is None else max(fmax, hi)
+
+    if fmin is None:
         raise RuntimeError(f"Object '{obj.name}' action has no keyframe points.")
 
     # Keyframes can be floats; treat frame indices as ints for stepping
-    fmin = int(round(min(frames)))
-    fmax = int(round(max(frames)))
-    return fmin, fmax
+    return int(round(fmin)), int(round(fmax))
 
 def ensure_vortex_dynamic(vortex_obj: bpy.types.Object) -> bpy.types.Object:
     # If exists already, reuse it (do not create duplicates)
@@ -69,26 +79,163 @@ def ensure_vortex_dynamic(vortex_obj: bpy.types.Object) -> bpy.types.Object:
 
     return new_obj
 
-def evaluated_state(obj: bpy.types.Object, depsgraph):
-    obj_eval = obj.evaluated_get(depsgraph)
+def evaluated_quat(obj: bpy.types.Object, depsgraph) -> Quaternion:
+    # Evaluated world rotation as quaternion for robust composition
+    return obj.evaluated_get(depsgraph).matrix_world.to_quaternion()
 
-    # Rotation as quaternion for robust composition
-    q = obj_eval.matrix_world.to_quaternion()
+def evaluated_strength(obj: bpy.types.Object, depsgraph):
+    # Evaluated force-field strength (for Vortex objects), None without a field
+    field = getattr(obj.evaluated_get(depsgraph), "field", None)
+    return float(field.strength) if field else None
 
-    # Force-field strength (for Vortex objects)
-    strength = None
-    if hasattr(obj_eval, "field") and obj_eval.field:
-        strength = float(obj_eval.field.strength)
+def action_fcurves(obj: bpy.types.Object):
+    # {(data_path, array_index): fcurve} for the object's action; empty if unanimated
+    ad = obj.animation_data
+    if not ad or not ad.action:
+        return {}
+    return {(fc.data_path, fc.array_index): fc for fc in ad.action.fcurves}
 
-    return q, strength, obj_eval
+def can_sample_fcurves(obj: bpy.types.Object) -> bool:
+    # F-curve values equal the evaluated world rotation only for a plain object:
+    # no parent, constraints, delta rotation, drivers or NLA, and an Euler/quaternion
+    # rotation mode
+    ad = obj.animation_data
+    if obj.parent or len(obj.constraints) or obj.rotation_mode == 'AXIS_ANGLE':
+        return False
+    if any(obj.delta_rotation_euler) or tuple(obj.delta_rotation_quaternion) != (1.0, 0.0, 0.0, 0.0):
+        return False
+    if ad and (len(ad.drivers) or len(ad.nla_tracks)):
+        return False
+    return True
+
+def fcurve_value(fcurves, data_path: str, index: int, frame: float, default: float) -> float:
+    fc = fcurves.get((data_path, index))
+    return fc.evaluate(frame) if fc else default
+
+def fcurve_rotation_quat(obj: bpy.types.Object, fcurves, frame: float) -> Quaternion:
+    # Rotation at `frame` straight from the F-curves, without a depsgraph update
+    if obj.rotation_mode == 'QUATERNION':
+        q = Quaternion([fcurve_value(fcurves, "rotation_quaternion", i, frame, obj.rotation_quaternion[i])
+                        for i in range(4)])
+        q.normalize()
+        return q
+    e = Euler([fcurve_value(fcurves, "rotation_euler", i, frame, obj.rotation_euler[i])
+               for i in range(3)], obj.rotation_mode)
+    return e.to_quaternion()
+
+def sample_inputs(scene, depsgraph, vortex, vortex_dyn, frame_first: int, frame_last: int):
+    # Vortex rotation quats (N, 4) and Vortex-dynamic strengths (N, or None without a
+    # field) over the whole range. Neither is written by this script, so both can be
+    # read up front: from the F-curves when possible, else with one frame_set per frame.
+    quats = []
+    strengths = []
+    if can_sample_fcurves(vortex) and can_sample_fcurves(vortex_dyn):
+        vortex_fc = action_fcurves(vortex)
+        dyn_fc = action_fcurves(vortex_dyn)
+        field = vortex_dyn.field
+        for f in range(frame_first, frame_last + 1):
+            quats.append(fcurve_rotation_quat(vortex, vortex_fc, f))
+            if field:
+                strengths.append(float(fcurve_value(dyn_fc, "field.strength", 0, f, field.strength)))
+    else:
+        for f in range(frame_first, frame_last + 1):
+            scene.frame_set(f)
+            quats.append(evaluated_quat(vortex, depsgraph))
+            strength = evaluated_strength(vortex_dyn, depsgraph)
+            if strength is not None:
+                strengths.append(strength)
+        scene.frame_set(frame_first)
+    quats = np.array([tuple(q) for q in quats], dtype=np.float64)
+    if len(strengths) != len(quats):
+        return quats, None
+    return quats, np.array(strengths, dtype=np.float64)
+
+def quat_mul(a, b):
+    # Hamilton product of (..., 4) wxyz arrays, same convention as mathutils a @ b
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+def quat_cumprod(q):
+    # Running products q[0] @ q[1] @ ... @ q[i] for every i, in log2(N) vectorized
+    # passes (Hillis-Steele scan) instead of one Python-level product per frame
+    out = q.copy()
+    step = 1
+    while step < len(out):
+        out[step:] = quat_mul(out[:-step], out[step:])
+        step *= 2
+    return out
+
+def quat_local_z(q):
+    # Local Z axis of each (..., 4) wxyz unit quaternion, in the parent space
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    axis = np.stack((2.0 * (x * z + w * y), 2.0 * (y * z - w * x), 1.0 - 2.0 * (x * x + y * y)), axis=-1)
+    return axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+
+def write_keys(owner, prop: str, frames, values):
+    """
+    Key owner.<prop> at every frame in one batch per channel, instead of a
+    keyframe_insert per frame. values is one row (tuple/vector) per frame.
+    Keys already on those frames are overwritten, as keyframe_insert would.
+    """
+    frames = [float(f) for f in frames]
+    if not frames:
+        return
+    values = np.asarray(values, dtype=np.float64).reshape(len(frames), -1)
+
+    data_path = owner.path_from_id(prop)
+    ad = owner.id_data.animation_data
+    action = ad.action if ad else None
+    if action is None:
+        # Let Blender create the action/F-curves (and their group) the usual way
+        setattr(owner, prop, tuple(values[0]))
+        owner.keyframe_insert(data_path=prop, frame=frames[0])
+        action = owner.id_data.animation_data.action
+
+    for i in range(values.shape[1]):
+        fc = action.fcurves.find(data_path, index=i)
+        if fc is None:
+            # Channel not keyed yet (e.g. only X was): create it the usual way too
+            setattr(owner, prop, tuple(values[0]))
+            owner.keyframe_insert(data_path=prop, index=i, frame=frames[0])
+            fc = action.fcurves.find(data_path, index=i)
+        kps = fc.keyframe_points
+        co = np.empty(2 * len(kps))
+        kps.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+
+        slot = {int(round(x)): k for k, x in enumerate(co[:, 0]) if abs(x - round(x)) < 0.01}
+        new = []
+        for f, v in zip(frames, values[:, i]):
+            k = slot.get(int(f))
+            if k is None:
+                new.append((f, v))
+            else:
+                co[k, 1] = v
+        if new:
+            kps.add(len(new))
+            co = np.concatenate([co, np.array(new)])
+        kps.foreach_set("co", co.ravel())
+        fc.update()
+
+    # Leave the property at the last written value, like the per-frame loop did
+    setattr(owner, prop, tuple(values[-1]))
 
 def quat_to_euler_xyz(q: Quaternion) -> Euler:
-    e = q.to_euler(EULER_ORDER)
-    return Euler((e.x, e.y, e.z), EULER_ORDER)
+    return q.to_euler(EULER_ORDER)
 
 def euler_deg(e: Euler):
     return (math.degrees(e.x), math.degrees(e.y), math.degrees(e.z))
 
+def euler_deg6(e: Euler):
+    # euler_deg rounded for prints
+    return tuple(round(x, 6) for x in euler_deg(e))
+
 def wrap_angle_deg(a):
     # keep readable in prints
     while a > 180.0:
@@ -130,74 +277,79 @@ print(f"[INFO] Keyframed terrain.location at frame {frame_first} (existing keyfr
 
 # Store "terrain rotation at frame 1" as reference for displacement
 # Use evaluated quaternion for consistency with interpolation
-scene.frame_set(frame_first)
-terrain_q_first, _, _ = evaluated_state(terrain, depsgraph)
-
-# Process frames from second frame up to last
-for f in range(frame_first + 1, frame_last + 1):
-    prev_f = f - 1
-
-    # --- Gather PREVIOUS frame evaluated state (Step 1 inputs) ---
-    scene.frame_set(prev_f)
-
-    terrain_q_prev, _, _ = evaluated_state(terrain, depsgraph)
-    vortex_dyn_q_prev, strength_prev, _ = evaluated_state(vortex_dyn, depsgraph)
-
-    if strength_prev is None:
-        raise RuntimeError(f"'{vortex_dyn.name}' does not appear to have a force field strength (not a Vortex force field?).")
-
-    degrees_to_rotate = -SCALE * strength_prev
-    radians_to_rotate = math.radians(degrees_to_rotate)
-
-    # Axis = Vortex-dynamic local Z axis, rotated into world space by its rotation
-    axis_world = (vortex_dyn_q_prev @ Vector((0.0, 0.0, 1.0))).normalized()
-    rot_q = Quaternion(axis_world, radians_to_rotate)
-
-    # Apply world-space rotation to terrain rotation
-    terrain_q_new = rot_q @ terrain_q_prev
-
-    # --- Write terrain rotation at CURRENT frame (Step 1 result) ---
-    scene.frame_set(f)
-    terrain.rotation_mode = EULER_ORDER
-    terrain.rotation_euler = quat_to_euler_xyz(terrain_q_new)
-    terrain.keyframe_insert(data_path="rotation_euler", frame=f)
-
-    # --- Step 2: displacement from terrain frame_first, applied to current Vortex rotation ---
-    displacement_q = terrain_q_new @ terrain_q_first.inverted()
-
-    # Get CURRENT frame interpolated Vortex rotation
-    vortex_q_cur, _, _ = evaluated_state(vortex, depsgraph)
-
-    vortex_dyn_q_new = displacement_q @ vortex_q_cur
-
-    # Write Vortex-dynamic rotation at CURRENT frame
-    vortex_dyn.rotation_mode = EULER_ORDER
-    vortex_dyn.rotation_euler = quat_to_euler_xyz(vortex_dyn_q_new)
-    vortex_dyn.keyframe_insert(data_path="rotation_euler", frame=f)
-
-    # --- Prints ---
-    terrain_e_prev = quat_to_euler_xyz(terrain_q_prev)
-    terrain_e_new  = quat_to_euler_xyz(terrain_q_new)
+terrain_q_first = evaluated_quat(terrain, depsgraph)
+
+# Inputs as arrays over frame_first..frame_last (index 0 = frame_first)
+vortex_dyn_q_first = evaluated_quat(vortex_dyn, depsgraph)
+vortex_q_arr, strength_arr = sample_inputs(scene, depsgraph, vortex, vortex_dyn, frame_first, frame_last)
+
+if strength_arr is None:
+    raise RuntimeError(f"'{vortex_dyn.name}' does not appear to have a force field strength (not a Vortex force field?).")
+
+key_frames = list(range(frame_first + 1, frame_last + 1))
+terrain_first = np.array(tuple(terrain_q_first), dtype=np.float64)
+# Unit quaternion (from a rotation matrix): the inverse is just the conjugate
+terrain_first_inv = terrain_first * (1.0, -1.0, -1.0, -1.0)
+
+# Each frame rotates terrain about Vortex-dynamic's (previous frame) local Z axis in
+# world space. Written in terrain's own frame that axis is fixed by the inputs alone:
+#   Vortex-dynamic(prev) = terrain(prev) @ terrain(first)^-1 @ Vortex(prev)
+# so terrain(f) = terrain(prev) @ local_rot(f), a running product of rotations that
+# can all be built up front. Only frame_first reads Vortex-dynamic from the scene.
+degrees_arr = -SCALE * strength_arr[:-1]
+half = np.radians(degrees_arr) * 0.5
+src_q = vortex_q_arr[:-1].copy()
+src_q[:1] = tuple(vortex_dyn_q_first)
+local_axis = quat_local_z(quat_mul(terrain_first_inv, src_q))
+local_rot = np.column_stack((np.cos(half), np.sin(half)[:, None] * local_axis))
+
+terrain_q_arr = quat_mul(terrain_first, quat_cumprod(local_rot))
+
+# Step 2: displacement from terrain frame_first, applied to current Vortex rotation
+displacement_arr = quat_mul(terrain_q_arr, terrain_first_inv)
+vortex_dyn_q_arr = quat_mul(displacement_arr, vortex_q_arr[1:])
+
+# Eulers through mathutils so EULER_ORDER and Blender's angle choice are kept
+terrain_eulers = [Quaternion(q).to_euler(EULER_ORDER) for q in terrain_q_arr.tolist()]
+vortex_dyn_eulers = [Quaternion(q).to_euler(EULER_ORDER) for q in vortex_dyn_q_arr.tolist()]
+
+# --- Prints ---
+if PRINT_FRAMES:
     terrain_e_first = quat_to_euler_xyz(terrain_q_first)
-    disp_e = quat_to_euler_xyz(displacement_q)
-    vortex_e_cur = quat_to_euler_xyz(vortex_q_cur)
-    vortexdyn_e_new = quat_to_euler_xyz(vortex_dyn_q_new)
-
-    print("------------------------------------------------------------")
-    print(f"[FRAME {f}] prev_frame={prev_f}")
-    print(f"  Step 1 inputs:")
-    print(f"    Vortex-dynamic strength(prev) = {strength_prev:.6f}")
-    print(f"    Degrees rotated = SCALE * strength = {SCALE} * {strength_prev:.6f} = {degrees_to_rotate:.6f} deg")
-    print(f"    Axis(world) = ({axis_world.x:.6f}, {axis_world.y:.6f}, {axis_world.z:.6f})")
-    print(f"    terrain rot(prev) deg = {tuple(round(x, 6) for x in euler_deg(terrain_e_prev))}")
-    print(f"  Step 1 result:")
-    print(f"    terrain rot(new)  deg = {tuple(round(x, 6) for x in euler_deg(terrain_e_new))}")
-    print(f"  Step 2:")
-    print(f"    terrain rot(frame1) deg = {tuple(round(x, 6) for x in euler_deg(terrain_e_first))}")
-    print(f"    total displacement (quat->euler) deg = {tuple(round(x, 6) for x in euler_deg(disp_e))}")
-    print(f"    Vortex rot(cur, interpolated) deg = {tuple(round(x, 6) for x in euler_deg(vortex_e_cur))}")
-    print(f"    Vortex-dynamic rot(new) deg = {tuple(round(x, 6) for x in euler_deg(vortexdyn_e_new))}")
-    print("------------------------------------------------------------")
+    vortex_dyn_q_prev_arr = np.vstack((src_q[:1], vortex_dyn_q_arr[:-1]))
+    axis_world_arr = quat_local_z(vortex_dyn_q_prev_arr)
+    terrain_e_prevs = [terrain_e_first] + terrain_eulers[:-1]
+
+    for i, f in enumerate(key_frames):
+        strength_prev = strength_arr[i]
+        degrees_to_rotate = degrees_arr[i]
+        axis_world = axis_world_arr[i]
+        disp_e = Quaternion(displacement_arr[i].tolist()).to_euler(EULER_ORDER)
+        vortex_e_cur = Quaternion(vortex_q_arr[i + 1].tolist()).to_euler(EULER_ORDER)
+
+        # One write per frame instead of one per line
+        print("\n".join((
+            "------------------------------------------------------------",
+            f"[FRAME {f}] prev_frame={f - 1}",
+            f"  Step 1 inputs:",
+            f"    Vortex-dynamic strength(prev) = {strength_prev:.6f}",
+            f"    Degrees rotated = SCALE * strength = {SCALE} * {strength_prev:.6f} = {degrees_to_rotate:.6f} deg",
+            f"    Axis(world) = ({axis_world[0]:.6f}, {axis_world[1]:.6f}, {axis_world[2]:.6f})",
+            f"    terrain rot(prev) deg = {euler_deg6(terrain_e_prevs[i])}",
+            f"  Step 1 result:",
+            f"    terrain rot(new)  deg = {euler_deg6(terrain_eulers[i])}",
+            f"  Step 2:",
+            f"    terrain rot(frame1) deg = {euler_deg6(terrain_e_first)}",
+            f"    total displacement (quat->euler) deg = {euler_deg6(disp_e)}",
+            f"    Vortex rot(cur, interpolated) deg = {euler_deg6(vortex_e_cur)}",
+            f"    Vortex-dynamic rot(new) deg = {euler_deg6(vortex_dyn_eulers[i])}",
+            "------------------------------------------------------------",
+        )))
+
+terrain.rotation_mode = EULER_ORDER
+vortex_dyn.rotation_mode = EULER_ORDER
+write_keys(terrain, "rotation_euler", key_frames, terrain_eulers)
+write_keys(vortex_dyn, "rotation_euler", key_frames, vortex_dyn_eulers)
 
 # Restore original current frame if you want; optional
 # scene.frame_set(frame_first)
@@ -28,16 +28,26 @@ def remove_object_by_name(name: str) -> bool:
     return True
 
 
-def clear_keyframes(obj: bpy.types.Object):
+def clear_keyframes(obj: bpy.types.Object, clear_materials: bool = True):
     # Clears object animation/action
     if obj.animation_data:
         log(f'Clearing animation data on "{obj.name}"...')
-    obj.animation_data_clear()
-
-    # Also clear material animation (optional but often desired)
-    if obj.active_material and obj.active_material.animation_data:
-        log(f'Clearing material animation data on "{obj.name}" (active material "{obj.active_material.name}")...')
-        obj.active_material.animation_data_clear()
+        obj.animation_data_clear()
+
+    # Also clear material animation: diffuse_color keys live on the material,
+    # Base Color socket keys on its node tree. Only touched when asked, since
+    # every animation_data_clear tags the depsgraph.
+    if not clear_materials or obj.type != "MESH":
+        return
+    for mat in obj.data.materials:
+        if not mat:
+            continue
+        if mat.animation_data:
+            log(f'Clearing material animation data on "{obj.name}" (material "{mat.name}")...')
+            mat.animation_data_clear()
+        if mat.node_tree and mat.node_tree.animation_data:
+            log(f'Clearing node tree animation data on "{obj.name}" (material "{mat.name}")...')
+            mat.node_tree.animation_data_clear()
 
 
 def zero_rotation(obj: bpy.types.Object):
@@ -49,10 +59,9 @@ def zero_rotation(obj: bpy.types.Object):
 def main():
     log("Starting cleanup...")
 
-    # 1) Delete Vortex-dynamic (if present)
-    remove_object_by_name(VORTEX_NAME)
-
-    # 2) For cross + terrain: delete all keyframes and zero rotation
+    # 1) For cross + terrain: delete all keyframes and zero rotation.
+    # Done before any object removal so the animation clears are batched together;
+    # only the cross has animated materials (script6's white preroll).
     for name in TARGET_NAMES:
         obj = get_obj(name)
         if not obj:
@@ -60,10 +69,13 @@ def main():
             continue
 
         log(f'Processing "{name}"...')
-        clear_keyframes(obj)
+        clear_keyframes(obj, clear_materials=(name == "cross"))
         zero_rotation(obj)
         log(f'Finished "{name}".')
 
+    # 2) Delete Vortex-dynamic (if present)
+    remove_object_by_name(VORTEX_NAME)
+
     log("Done.")
 
 
@@ -1,5 +1,6 @@
 import bpy
 import math
+import numpy as np
 from mathutils import Quaternion, Vector
 
 # -----------------------------
@@ -28,25 +29,28 @@ def get_rotation_keyframes(obj: bpy.types.Object):
     if not ad or not ad.action:
         raise RuntimeError(f'Object "{obj.name}" has no animation action.')
 
-    frames = set()
+    # One foreach_get per F-curve instead of a Python read per keyframe
+    xs = []
     for fc in ad.action.fcurves:
         if fc.data_path == "rotation_euler" and fc.array_index in (0, 1, 2):
-            for kp in fc.keyframe_points:
-                frames.add(int(round(kp.co.x)))
+            co = np.empty(len(fc.keyframe_points) * 2, dtype=np.float32)
+            fc.keyframe_points.foreach_get("co", co)
+            xs.append(co[0::2])
 
-    if not frames:
+    frames = np.unique(np.round(np.concatenate(xs)).astype(np.int64)) if xs else []
+    if not len(frames):
         raise RuntimeError(f'Object "{obj.name}" has no rotation_euler keyframes.')
 
-    frames_sorted = sorted(frames)
+    frames_sorted = frames.tolist()
     return frames_sorted, frames_sorted[0], frames_sorted[-1]
 
-def eval_world_quat_at_frame(scene: bpy.types.Scene, obj: bpy.types.Object, frame: int) -> Quaternion:
+def eval_world_quat_at_frame(scene: bpy.types.Scene, depsgraph, obj: bpy.types.Object, frame: int) -> Quaternion:
     """
     Evaluates the object's WORLD rotation at a given frame.
+    The depsgraph is fetched once by the caller; frame_set updates it in place.
     """
     scene.frame_set(frame)
-    deps = bpy.context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(deps)
+    obj_eval = obj.evaluated_get(depsgraph)
     return obj_eval.matrix_world.to_quaternion()
 
 def quat_to_euler_like_obj(obj: bpy.types.Object, q: Quaternion):
@@ -59,6 +63,69 @@ def quat_to_euler_like_obj(obj: bpy.types.Object, q: Quaternion):
         mode = "XYZ"
     return q.to_euler(mode)
 
+def write_keys(owner, prop: str, frames, values):
+    """
+    Key owner.<prop> at every frame in one batch per channel, instead of a
+    keyframe_insert per frame. values is one row (tuple/vector) per frame.
+    Keys already on those frames are overwritten, as keyframe_insert would.
+    """
+    frames = [float(f) for f in frames]
+    if not frames:
+        return
+    values = np.asarray(values, dtype=np.float64).reshape(len(frames), -1)
+
+    data_path = owner.path_from_id(prop)
+    ad = owner.id_data.animation_data
+    action = ad.action if ad else None
+    if action is None:
+        # Let Blender create the action/F-curves (and their group) the usual way
+        setattr(owner, prop, tuple(values[0]))
+        owner.keyframe_insert(data_path=prop, frame=frames[0])
+        action = owner.id_data.animation_data.action
+
+    for i in range(values.shape[1]):
+        fc = action.fcurves.find(data_path, index=i)
+        if fc is None:
+            # Channel not keyed yet (e.g. only X was): create it the usual way too
+            setattr(owner, prop, tuple(values[0]))
+            owner.keyframe_insert(data_path=prop, index=i, frame=frames[0])
+            fc = action.fcurves.find(data_path, index=i)
+        kps = fc.keyframe_points
+        co = np.empty(2 * len(kps))
+        kps.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+
+        slot = {int(round(x)): k for k, x in enumerate(co[:, 0]) if abs(x - round(x)) < 0.01}
+        new = []
+        for f, v in zip(frames, values[:, i]):
+            k = slot.get(int(f))
+            if k is None:
+                new.append((f, v))
+            else:
+                co[k, 1] = v
+        if new:
+            kps.add(len(new))
+            co = np.concatenate([co, np.array(new)])
+        kps.foreach_set("co", co.ravel())
+        fc.update()
+
+    # Leave the property at the last written value, like the per-frame loop did
+    setattr(owner, prop, tuple(values[-1]))
+
+def world_z_half_angles(angles_rad):
+    """cos/sin of each half-angle, computed for all frames at once."""
+    half = 0.5 * np.asarray(angles_rad, dtype=np.float64)
+    return np.cos(half), np.sin(half)
+
+def rotate_about_world_z(q: Quaternion, cw: float, sw: float) -> Quaternion:
+    """
+    Quaternion(WORLD_Z, angle) @ q in closed form, given the half-angle
+    cos/sin: the Z-only rotation (cw, 0, 0, sw) reduces the product to a few
+    multiply-adds.
+    """
+    w, x, y, z = q
+    return Quaternion((cw * w - sw * z, cw * x - sw * y, cw * y + sw * x, cw * z + sw * w))
+
 def rad_to_deg3(e):
     return (math.degrees(e.x), math.degrees(e.y), math.degrees(e.z))
 
@@ -66,11 +133,13 @@ def apply_world_z_increment_and_key(obj: bpy.types.Object,
                                     first_frame: int,
                                     last_terrain_frame: int,
                                     extra_frames: int,
-                                    deg_per_frame: float):
+                                    deg_per_frame: float,
+                                    depsgraph):
     scene = bpy.context.scene
 
     # Cache last-frame world rotation for constant hold beyond last_terrain_frame
-    last_world_q = eval_world_quat_at_frame(scene, obj, last_terrain_frame)
+    last_world_q = eval_world_quat_at_frame(scene, depsgraph, obj, last_terrain_frame)
+    last_e = quat_to_euler_like_obj(obj, last_world_q)
 
     start = first_frame
     end   = last_terrain_frame + extra_frames
@@ -78,52 +147,60 @@ def apply_world_z_increment_and_key(obj: bpy.types.Object,
     print(f"\n=== Processing '{obj.name}' from frame {start} (untouched) to {end} ===")
     print("Frame | Original(deg XYZ) | AddWorldZ(deg, +CW) | NewOverwritten(deg XYZ)")
 
+    # New rotations are keyed in one batch after the loop. Originals are read from
+    # the untouched curve, before any of this object's keys are overwritten.
+    key_frames = []
+    new_eulers = []
+
+    # Increasing amount: next keyframe = 1*DEG_PER_FRAME, then 2*..., etc.
+    add_deg_arr = np.arange(1, end - start + 1) * deg_per_frame
+    # Positive should be clockwise -> negate for Blender's right-hand rule
+    cos_half, sin_half = world_z_half_angles(-np.radians(add_deg_arr))
+
     for f in range(start, end + 1):
         if f == start:
             # Leave first frame untouched, but still print original for clarity
-            orig_q = eval_world_quat_at_frame(scene, obj, f)
+            orig_q = eval_world_quat_at_frame(scene, depsgraph, obj, f)
             orig_e = quat_to_euler_like_obj(obj, orig_q)
             print(f"{f:5d} | {rad_to_deg3(orig_e)!s:>20} | {0.0:>15.6f} | {rad_to_deg3(orig_e)!s:>22}")
             continue
 
-        # Increasing amount: next keyframe = 1*DEG_PER_FRAME, then 2*..., etc.
-        step_count = (f - start)  # 1,2,3,...
-        add_deg = step_count * deg_per_frame
-
-        # Positive should be clockwise -> negate for Blender's right-hand rule
-        add_rad = -math.radians(add_deg)
+        k = f - start - 1  # step 1,2,3,... -> index 0,1,2,...
+        add_deg = add_deg_arr[k]
 
         # Evaluate "original" at this frame (but after last terrain frame, hold constant)
         if f <= last_terrain_frame:
-            orig_q = eval_world_quat_at_frame(scene, obj, f)
+            orig_q = eval_world_quat_at_frame(scene, depsgraph, obj, f)
+            orig_e = quat_to_euler_like_obj(obj, orig_q)
         else:
-            orig_q = last_world_q.copy()
+            orig_q = last_world_q
+            orig_e = last_e
 
         # Apply rotation about WORLD Z "on top of" existing: pre-multiply
-        rotz_q = Quaternion(WORLD_Z, add_rad)
-        new_q = rotz_q @ orig_q
+        new_q = rotate_about_world_z(orig_q, cos_half[k], sin_half[k])
 
-        orig_e = quat_to_euler_like_obj(obj, orig_q)
         new_e  = quat_to_euler_like_obj(obj, new_q)
 
-        # Overwrite keys: set euler then insert keyframe
-        # (Ensures a key is created for EXTRA_FRAMES too.)
-        if obj.rotation_mode in {"QUATERNION", "AXIS_ANGLE"}:
-            # Force Euler overwrite path; keep the object's mode unchanged
-            old_mode = obj.rotation_mode
-            obj.rotation_mode = "XYZ"
-            obj.rotation_euler = new_e
-            obj.keyframe_insert(data_path="rotation_euler", frame=f)
-            obj.rotation_mode = old_mode
-        else:
-            obj.rotation_euler = new_e
-            obj.keyframe_insert(data_path="rotation_euler", frame=f)
+        # Overwrite keys (also creates keys for EXTRA_FRAMES)
+        key_frames.append(f)
+        new_eulers.append(new_e)
 
         print(f"{f:5d} | {rad_to_deg3(orig_e)!s:>20} | {add_deg:15.6f} | {rad_to_deg3(new_e)!s:>22}")
 
+    if obj.rotation_mode in {"QUATERNION", "AXIS_ANGLE"}:
+        # Force Euler overwrite path; keep the object's mode unchanged
+        old_mode = obj.rotation_mode
+        obj.rotation_mode = "XYZ"
+        write_keys(obj, "rotation_euler", key_frames, new_eulers)
+        obj.rotation_mode = old_mode
+    else:
+        write_keys(obj, "rotation_euler", key_frames, new_eulers)
+
 # -----------------------------
 # MAIN
 # -----------------------------
+depsgraph = bpy.context.evaluated_depsgraph_get()
+
 terrain = get_obj("terrain")
 cross   = get_obj("cross")
 
@@ -131,7 +208,7 @@ cross   = get_obj("cross")
 terrain_frames, first_frame, last_terrain_frame = get_rotation_keyframes(terrain)
 
 # Apply to both terrain and cross using terrain's last frame + EXTRA_FRAMES
-apply_world_z_increment_and_key(terrain, first_frame, last_terrain_frame, EXTRA_FRAMES, DEG_PER_FRAME)
-apply_world_z_increment_and_key(cross,   first_frame, last_terrain_frame, EXTRA_FRAMES, DEG_PER_FRAME)
+apply_world_z_increment_and_key(terrain, first_frame, last_terrain_frame, EXTRA_FRAMES, DEG_PER_FRAME, depsgraph)
+apply_world_z_increment_and_key(cross,   first_frame, last_terrain_frame, EXTRA_FRAMES, DEG_PER_FRAME, depsgraph)
 
 print("\nDone.")
@@ -1,5 +1,6 @@
 import bpy
 import math
+import numpy as np
 from mathutils import Quaternion, Vector
 
 # --------------------------------
@@ -19,10 +20,10 @@ def get_obj(name):
         raise RuntimeError(f'Object "{name}" not found.')
     return obj
 
-def eval_world_quat(scene, obj, frame):
+def eval_world_quat(scene, depsgraph, obj, frame):
+    # depsgraph is fetched once by the caller; frame_set updates it in place
     scene.frame_set(frame)
-    deps = bpy.context.evaluated_depsgraph_get()
-    return obj.evaluated_get(deps).matrix_world.to_quaternion()
+    return obj.evaluated_get(depsgraph).matrix_world.to_quaternion()
 
 def quat_to_euler(obj, quat):
     mode = obj.rotation_mode
@@ -30,6 +31,20 @@ def quat_to_euler(obj, quat):
         mode = "XYZ"
     return quat.to_euler(mode)
 
+def world_z_half_angles(angles_rad):
+    """cos/sin of each half-angle, computed for all frames at once."""
+    half = 0.5 * np.asarray(angles_rad, dtype=np.float64)
+    return np.cos(half), np.sin(half)
+
+def rotate_about_world_z(q: Quaternion, cw: float, sw: float) -> Quaternion:
+    """
+    Quaternion(WORLD_Z, angle) @ q in closed form, given the half-angle
+    cos/sin: the Z-only rotation (cw, 0, 0, sw) reduces the product to a few
+    multiply-adds.
+    """
+    w, x, y, z = q
+    return Quaternion((cw * w - sw * z, cw * x - sw * y, cw * y + sw * x, cw * z + sw * w))
+
 def deg_xyz(e):
     return (
         math.degrees(e.x),
@@ -37,39 +52,85 @@ def deg_xyz(e):
         math.degrees(e.z),
     )
 
+def write_keys(owner, prop: str, frames, values):
+    """
+    Key owner.<prop> at every frame in one batch per channel, instead of a
+    keyframe_insert per frame. values is one row (tuple/vector) per frame.
+    Keys already on those frames are overwritten, as keyframe_insert would.
+    """
+    frames = [float(f) for f in frames]
+    if not frames:
+        return
+    values = np.asarray(values, dtype=np.float64).reshape(len(frames), -1)
+
+    data_path = owner.path_from_id(prop)
+    ad = owner.id_data.animation_data
+    action = ad.action if ad else None
+    if action is None:
+        # Let Blender create the action/F-curves (and their group) the usual way
+        setattr(owner, prop, tuple(values[0]))
+        owner.keyframe_insert(data_path=prop, frame=frames[0])
+        action = owner.id_data.animation_data.action
+
+    for i in range(values.shape[1]):
+        fc = action.fcurves.find(data_path, index=i)
+        if fc is None:
+            # Channel not keyed yet (e.g. only X was): create it the usual way too
+            setattr(owner, prop, tuple(values[0]))
+            owner.keyframe_insert(data_path=prop, index=i, frame=frames[0])
+            fc = action.fcurves.find(data_path, index=i)
+        kps = fc.keyframe_points
+        co = np.empty(2 * len(kps))
+        kps.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+
+        slot = {int(round(x)): k for k, x in enumerate(co[:, 0]) if abs(x - round(x)) < 0.01}
+        new = []
+        for f, v in zip(frames, values[:, i]):
+            k = slot.get(int(f))
+            if k is None:
+                new.append((f, v))
+            else:
+                co[k, 1] = v
+        if new:
+            kps.add(len(new))
+            co = np.concatenate([co, np.array(new)])
+        kps.foreach_set("co", co.ravel())
+        fc.update()
+
+    # Leave the property at the last written value, like the per-frame loop did
+    setattr(owner, prop, tuple(values[-1]))
+
 # --------------------------------
 # CORE LOGIC
 # --------------------------------
-def process_object(obj):
+def process_object(obj, depsgraph):
     scene = bpy.context.scene
 
     base_frame = 1
-    base_world_q = eval_world_quat(scene, obj, base_frame)
+    base_world_q = eval_world_quat(scene, depsgraph, obj, base_frame)
 
     print(f"\n=== Processing '{obj.name}' ===")
     print("Frame | Original(deg XYZ) | AddWorldZ(deg, +CW) | NewOverwritten(deg XYZ)")
 
+    key_frames = []
+    new_eulers = []
+    orig_e = quat_to_euler(obj, base_world_q)  # same base rotation every frame
+
+    # Per-frame angles for all preroll frames at once
+    add_deg_arr = -np.arange(1, EXTRA_FRAMES + 1) * DEG_PER_FRAME       # subtract going backwards
+    cos_half, sin_half = world_z_half_angles(-np.radians(add_deg_arr))  # negate for +CW convention
+
     for i in range(1, EXTRA_FRAMES + 1):
         frame = base_frame - i
-        add_deg = -i * DEG_PER_FRAME        # subtract going backwards
-        add_rad = -math.radians(add_deg)    # negate for +CW convention
+        add_deg = add_deg_arr[i - 1]
 
-        rotz_q = Quaternion(WORLD_Z, add_rad)
-        new_world_q = rotz_q @ base_world_q
+        new_world_q = rotate_about_world_z(base_world_q, cos_half[i - 1], sin_half[i - 1])
 
-        orig_e = quat_to_euler(obj, base_world_q)
         new_e  = quat_to_euler(obj, new_world_q)
 
-        # Overwrite / insert key
-        if obj.rotation_mode in {"QUATERNION", "AXIS_ANGLE"}:
-            old_mode = obj.rotation_mode
-            obj.rotation_mode = "XYZ"
-            obj.rotation_euler = new_e
-            obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-            obj.rotation_mode = old_mode
-        else:
-            obj.rotation_euler = new_e
-            obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+        key_frames.append(frame)
+        new_eulers.append(new_e)
 
         print(
             f"{frame:5d} | "
@@ -78,13 +139,24 @@ def process_object(obj):
             f"{deg_xyz(new_e)!s:>22}"
         )
 
+    # Overwrite / insert keys, one batch per channel
+    if obj.rotation_mode in {"QUATERNION", "AXIS_ANGLE"}:
+        old_mode = obj.rotation_mode
+        obj.rotation_mode = "XYZ"
+        write_keys(obj, "rotation_euler", key_frames, new_eulers)
+        obj.rotation_mode = old_mode
+    else:
+        write_keys(obj, "rotation_euler", key_frames, new_eulers)
+
 # --------------------------------
 # MAIN
 # --------------------------------
+depsgraph = bpy.context.evaluated_depsgraph_get()
+
 terrain = get_obj("terrain")
 cross   = get_obj("cross")
 
-process_object(terrain)
-process_object(cross)
+process_object(terrain, depsgraph)
+process_object(cross, depsgraph)
 
 print("\nDone.")
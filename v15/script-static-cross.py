@@ -1,8 +1,21 @@
 import bpy
+import numpy as np
 
 CROSS_OBJ_NAME = "cross"
 VORTEX_OBJ_NAME = "Vortex"  # <-- change this if your vortex object has a different name
 
+# Cross color by strength sign: 0 -> white, negative -> red, positive -> blue
+COLOR_PALETTE = np.array([
+    (1.0, 1.0, 1.0, 1.0),  # white
+    (1.0, 0.0, 0.0, 1.0),  # red
+    (0.0, 0.0, 1.0, 1.0),  # blue
+])
+
+# Interpolation for the written keys, e.g. "CONSTANT" for hard color/scale switches.
+# None keeps Blender's default (Bezier), as keyframe_insert would.
+SCALE_INTERPOLATION = None
+COLOR_INTERPOLATION = None
+
 # -----------------------------
 # Helpers
 # -----------------------------
@@ -13,12 +26,19 @@ def get_obj(name: str):
     return obj
 
 def clear_object_animation(obj: bpy.types.Object):
-    if obj.animation_data and obj.animation_data.action:
-        obj.animation_data.action.fcurves.clear()
+    ad = obj.animation_data
+    if not ad:
+        return
+    # Detach the action (freeing it if nothing else uses it) rather than emptying it in
+    # place; drivers are left alone
+    action = ad.action
+    if action:
+        ad.action = None
+        if action.users == 0:
+            bpy.data.actions.remove(action)
     # Also clear NLA tracks if any (optional but usually desired when "delete all keyframes")
-    if obj.animation_data and obj.animation_data.nla_tracks:
-        for tr in list(obj.animation_data.nla_tracks):
-            obj.animation_data.nla_tracks.remove(tr)
+    for tr in list(ad.nla_tracks):
+        ad.nla_tracks.remove(tr)
 
 def ensure_principled_material(obj: bpy.types.Object) -> bpy.types.Material:
     if not obj.data or not hasattr(obj.data, "materials"):
@@ -62,8 +82,75 @@ def ensure_principled_material(obj: bpy.types.Object) -> bpy.types.Material:
 
     return mat
 
-def key_material_base_color(mat: bpy.types.Material, frame: int, rgba):
-    # Keyframe Principled Base Color
+def interpolation_enum_value(name: str) -> int:
+    return bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items[name].value
+
+def write_keys(owner, prop: str, frames, values, interpolation=None):
+    """
+    Key owner.<prop> at every frame in one batch per channel, instead of a
+    keyframe_insert per frame. values is one row (tuple/vector) per frame.
+    Keys already on those frames are overwritten, as keyframe_insert would.
+    interpolation (e.g. "CONSTANT") is applied to the written keys if given.
+    """
+    frames = [float(f) for f in frames]
+    if not frames:
+        return
+    values = np.asarray(values, dtype=np.float64).reshape(len(frames), -1)
+
+    data_path = owner.path_from_id(prop)
+    ad = owner.id_data.animation_data
+    action = ad.action if ad else None
+    if action is None:
+        # Let Blender create the action/F-curves (and their group) the usual way
+        setattr(owner, prop, tuple(values[0]))
+        owner.keyframe_insert(data_path=prop, frame=frames[0])
+        action = owner.id_data.animation_data.action
+
+    for i in range(values.shape[1]):
+        fc = action.fcurves.find(data_path, index=i)
+        if fc is None:
+            # Channel not keyed yet (e.g. only X was): create it the usual way too
+            setattr(owner, prop, tuple(values[0]))
+            owner.keyframe_insert(data_path=prop, index=i, frame=frames[0])
+            fc = action.fcurves.find(data_path, index=i)
+        kps = fc.keyframe_points
+        co = np.empty(2 * len(kps))
+        kps.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+
+        slot = {int(round(x)): k for k, x in enumerate(co[:, 0]) if abs(x - round(x)) < 0.01}
+        new = []
+        keyed = []
+        for f, v in zip(frames, values[:, i]):
+            k = slot.get(int(f))
+            if k is None:
+                new.append((f, v))
+            else:
+                co[k, 1] = v
+                keyed.append(k)
+        if new:
+            keyed.extend(range(len(co), len(co) + len(new)))
+            kps.add(len(new))
+            co = np.concatenate([co, np.array(new)])
+        kps.foreach_set("co", co.ravel())
+
+        if interpolation is not None:
+            if bpy.app.version >= (2, 90, 0):
+                # Enum foreach_get/set works from 2.90: one call instead of one setter per key
+                ipo = np.empty(len(kps), dtype=np.int32)
+                kps.foreach_get("interpolation", ipo)
+                ipo[keyed] = interpolation_enum_value(interpolation)
+                kps.foreach_set("interpolation", ipo)
+            else:
+                for k in keyed:
+                    kps[k].interpolation = interpolation
+        fc.update()
+
+    # Leave the property at the last written value, like the per-frame loop did
+    setattr(owner, prop, tuple(values[-1]))
+
+def key_material_base_color(mat: bpy.types.Material, frames, colors):
+    # Keyframe Principled Base Color at every frame, one batch per RGBA channel
     principled = None
     for n in mat.node_tree.nodes:
         if n.type == "BSDF_PRINCIPLED":
@@ -72,14 +159,20 @@ def key_material_base_color(mat: bpy.types.Material, frame: int, rgba):
     if principled is None:
         raise RuntimeError(f'Material "{mat.name}" has no Principled BSDF node.')
 
-    principled.inputs["Base Color"].default_value = rgba
-    principled.inputs["Base Color"].keyframe_insert(data_path="default_value", frame=frame)
+    write_keys(principled.inputs["Base Color"], "default_value", frames, colors,
+               interpolation=COLOR_INTERPOLATION)
+
+def keyframe_coords(fcu: bpy.types.FCurve):
+    # (frames, values) of all keyframe points, read with one foreach_get
+    co = np.empty(2 * len(fcu.keyframe_points))
+    fcu.keyframe_points.foreach_get("co", co)
+    return co[0::2], co[1::2]
 
 def collect_keyed_frames_for_strength(vortex_obj: bpy.types.Object):
     """
     Collect frames where the vortex force-field "strength" is keyed.
     Tries common properties: field.strength, field.flow.
-    Returns (data_path, sorted_frames) where data_path is the property path to evaluate.
+    Returns (data_path, sorted_frames, fcurve) where fcurve is the F-curve to evaluate.
     """
     if vortex_obj.field is None:
         raise RuntimeError(f'Object "{vortex_obj.name}" has no force field (obj.field is None).')
@@ -88,54 +181,39 @@ def collect_keyed_frames_for_strength(vortex_obj: bpy.types.Object):
     if not (ad and ad.action):
         raise RuntimeError(f'Object "{vortex_obj.name}" has no animation action to read keyframes from.')
 
-    # Candidate properties used across Blender versions / setups
+    # Candidate properties used across Blender versions / setups, in order of preference
     candidates = [
         'field.strength',
         'field.flow',
     ]
 
-    found = {}
-    for fcu in ad.action.fcurves:
-        if fcu.data_path in candidates:
-            frames = set()
-            for kp in fcu.keyframe_points:
-                frames.add(int(round(kp.co.x)))
-            if frames:
-                found[fcu.data_path] = sorted(frames)
-
-    # Prefer field.strength if present, else any other
-    if 'field.strength' in found:
-        return 'field.strength', found['field.strength']
-
-    if found:
-        # return first found entry
-        data_path = next(iter(found.keys()))
-        return data_path, found[data_path]
+    # {data_path: fcurve} in one pass; keys are then read from the chosen curve only
+    fcus = {fcu.data_path: fcu for fcu in ad.action.fcurves if fcu.data_path in candidates}
+    for data_path in candidates:
+        fcu = fcus.get(data_path)
+        if fcu is not None and len(fcu.keyframe_points):
+            xs, _ = keyframe_coords(fcu)
+            return data_path, np.unique(np.round(xs).astype(np.int64)).tolist(), fcu
 
     raise RuntimeError(
         f'No keyframes found on {candidates} for "{vortex_obj.name}". '
         f'Keyframe the force strength (Field > Strength) and try again.'
     )
 
-def eval_vortex_strength_at_frame(vortex_obj: bpy.types.Object, data_path: str, frame: int) -> float:
-    scene = bpy.context.scene
-    old_frame = scene.frame_current
-    scene.frame_set(frame)
-
-    # Evaluate using the data_path we discovered
-    # data_path is like 'field.strength' or 'field.flow'
-    val = None
-    if data_path == 'field.strength':
-        val = float(vortex_obj.field.strength)
-    elif data_path == 'field.flow':
-        val = float(vortex_obj.field.flow)
-    else:
-        # fallback: try resolving dynamically (rarely needed)
-        # minimal safe approach:
-        raise RuntimeError(f"Unsupported strength data_path: {data_path}")
-
-    scene.frame_set(old_frame)
-    return val
+def eval_vortex_strength_at_frame(fcu: bpy.types.FCurve, frame: int) -> float:
+    # Evaluate the strength F-curve directly: same value the property takes at
+    # that frame, without two scene.frame_set depsgraph updates per call
+    return float(fcu.evaluate(frame))
+
+def eval_vortex_strengths(fcu: bpy.types.FCurve, frames) -> np.ndarray:
+    # When every frame holds exactly one key and no modifier reshapes the curve, the
+    # F-curve value there is the key's own value: take them straight from the
+    # keyframe points. Otherwise evaluate per frame.
+    xs, ys = keyframe_coords(fcu)
+    order = np.argsort(xs, kind="stable")
+    if not len(fcu.modifiers) and np.array_equal(xs[order], frames):
+        return ys[order]
+    return np.array([eval_vortex_strength_at_frame(fcu, fr) for fr in frames])
 
 # -----------------------------
 # Main
@@ -159,7 +237,7 @@ try:
     base_sx, base_sy, base_sz = cross.scale.x, cross.scale.y, cross.scale.z
 
     # Collect frames where vortex strength is keyed
-    strength_path, keyed_frames = collect_keyed_frames_for_strength(vortex)
+    strength_path, keyed_frames, strength_fcu = collect_keyed_frames_for_strength(vortex)
 
     print(f'[INFO] Found {len(keyed_frames)} keyed frames on "{vortex.name}" ({strength_path}): {keyed_frames}')
 
@@ -171,36 +249,34 @@ try:
     # start_frame = keyed_frames[0] if keyed_frames else scene.frame_start
     # cross.keyframe_insert(data_path="rotation_euler", frame=start_frame)
 
-    # For each strength keyframe, drive cross scale XY + material color
-    for fr in keyed_frames:
-        strength = eval_vortex_strength_at_frame(vortex, strength_path, fr)
-
-        # Color logic
-        if strength == 0.0:
-            color = (1.0, 1.0, 1.0, 1.0)  # white
-        elif strength < 0.0:
-            color = (1.0, 0.0, 0.0, 1.0)  # red
-        else:
-            color = (0.0, 0.0, 1.0, 1.0)  # blue
-
-        # Scale logic: scale_xy = base_xy * (1 + 10*strength)
-        factor = 1.0 + 10.0 * strength
-        cross.scale.x = base_sx * factor
-        cross.scale.y = base_sy * factor
-        cross.scale.z = base_sz  # unchanged
-
-        # Set frame, then keyframe scale and material color
-        scene.frame_set(fr)
-        cross.keyframe_insert(data_path="scale", frame=fr)
-        key_material_base_color(mat, fr, color)
-
-        print(
+    # Strength at every keyed frame, then the COLOR_PALETTE row for all of them at once
+    strengths = eval_vortex_strengths(strength_fcu, keyed_frames)
+    color_idx = np.where(strengths == 0.0, 0, np.where(strengths < 0.0, 1, 2))
+    colors = COLOR_PALETTE[color_idx]
+
+    # Scale logic for all keyed frames at once: scale_xy = base_xy * (1 + 10*strength),
+    # z unchanged. Written in one batch per axis below.
+    factors = 1.0 + 10.0 * strengths
+    scales = np.column_stack((base_sx * factors, base_sy * factors, np.full_like(factors, base_sz)))
+
+    # Report lines are collected and printed in one write after the loop
+    report = []
+    for fr, strength, factor, scale, color in zip(
+        keyed_frames, strengths.tolist(), factors.tolist(), scales.tolist(), colors.tolist()
+    ):
+        report.append(
             f'[KEYFRAME] frame={fr} strength={strength:.6f} '
             f'factor={factor:.6f} '
-            f'scale=({cross.scale.x:.6f}, {cross.scale.y:.6f}, {cross.scale.z:.6f}) '
-            f'color={color}'
+            f'scale=({scale[0]:.6f}, {scale[1]:.6f}, {scale[2]:.6f}) '
+            f'color={tuple(color)}'
         )
 
+    if report:
+        print("\n".join(report))
+
+    write_keys(cross, "scale", keyed_frames, scales, interpolation=SCALE_INTERPOLATION)
+    key_material_base_color(mat, keyed_frames, colors)
+
     print('[DONE] Completed keyframing "cross" from Vortex force-field strength.')
 
 except Exception as e: